@@ -60,7 +60,6 @@ SOFTWARE.
 '''
 
 import argparse
-import copy
 import sys
 from lxml import etree
 from pyaxidraw.axidraw_options import common_options
@@ -355,7 +354,9 @@ def axidraw_CLI(dev = False):
         svg_string = trivial_svg.encode('utf-8') # Need consistent encoding.
         p = etree.XMLParser(huge_tree=True, encoding='utf-8')
         adc.document = etree.ElementTree(etree.fromstring(svg_string, parser=p))
-        adc.original_document = copy.deepcopy(adc.document)
+        # No copy needed: the trivial document is never written out (see below), so
+        # nothing compares it against its original. axidraw_control shares it likewise.
+        adc.original_document = adc.document
     else:
         utils.effect_parse(adc, svg_input)
 
@@ -367,7 +368,7 @@ def axidraw_CLI(dev = False):
     adc.cli_api = True # Set flag that this is being called from the CLI.
 
     exit_status.run(adc.effect)    # Plot the document
-    if utils.has_output(adc) and not use_trivial_file:
+    if not use_trivial_file and utils.has_output(adc):
         utils.output_result(args.output_file, adc.outdoc)
 
     if adc.status_code >= 100: # Give non-zero exit code.
@@ -26,7 +26,7 @@ Requires Python 3.7 or newer and Pyserial 3.5 or newer.
 """
 __version__ = '3.9.7'  # Dated 2024-01-16
 
-import math
+import os
 import gettext
 import copy
 import logging
@@ -48,6 +48,46 @@ from axicli import utils as axicli_utils
 
 logger = logging.getLogger(__name__)
 
+PARSE_CHUNK = 1 << 20 # Characters of SVG string input per parser.feed() call
+TRIVIAL_SVG_BYTES = plot_utils.trivial_svg.encode('utf8') # Default document, pre-encoded
+UNIT_DIVISORS = {1: 2.54, 2: 25.4} # options.units -> divisor to inches (cm, mm)
+
+
+def read_svg_source(svg_input):
+    """
+    Return the SVG data given by svg_input: a file path (str or PathLike), an SVG
+    string, or SVG bytes. File contents are read as bytes and bytearray input is
+    copied, so the result is an immutable snapshot (bytes or str) of the input.
+    """
+    if isinstance(svg_input, (bytes, bytearray)):
+        return bytes(svg_input)
+    # Markup near the start means an SVG string; skip the filesystem check for it.
+    if '<' not in str(svg_input)[:256] and os.path.isfile(svg_input):
+        try:
+            with open(svg_input, 'rb') as file_ref:
+                return file_ref.read()
+        except OSError:
+            logger.error("Unable to open SVG input file.")
+            raise RuntimeError("Unable to open SVG input file.")
+    return svg_input
+
+
+def parse_svg(svg_source):
+    """Parse SVG data from read_svg_source(); return an lxml ElementTree"""
+    try:
+        if isinstance(svg_source, bytes): # File contents or SVG bytes; parsed in C
+            parse_ref = etree.XMLParser(huge_tree=True)
+            return etree.ElementTree(etree.fromstring(svg_source, parser=parse_ref))
+        # Encode and feed the string in chunks (need consistent encoding), rather
+        # than building a second, full-size bytes copy of a large document.
+        parse_ref = etree.XMLParser(huge_tree=True, encoding='utf8')
+        for start in range(0, len(svg_source), PARSE_CHUNK):
+            parse_ref.feed(svg_source[start:start + PARSE_CHUNK].encode('utf8'))
+        return etree.ElementTree(parse_ref.close())
+    except:
+        logger.error("Unable to open SVG input file.")
+        raise RuntimeError("Unable to open SVG input file.")
+
 
 class ErrConfig: # pylint: disable=too-few-public-methods
     '''Configure error reporting options for AxiDraw Python API'''
@@ -77,6 +117,23 @@ class AxiDraw(axidraw.AxiDraw):
         self.keyboard_pause = False
         self.errors = ErrConfig()
         self._interrupted = False # Duplicate flag for keyboard interrupt for special cases.
+        self._interactive_ok = False # True once interactive() has set up self.options
+
+    @property
+    def original_document(self):
+        """Unmodified copy of the document given to plot_setup(). plot_setup() keeps
+        a snapshot of its input (file contents, bytes, or string), and the copy is
+        parsed from that snapshot on first access, since most plots never read it.
+        Later changes to the input file or buffer do not affect it."""
+        if self._original_document is None and self._original_input is not None:
+            self._original_document = parse_svg(self._original_input)
+            self._original_input = None
+        return self._original_document
+
+    @original_document.setter
+    def original_document(self, value):
+        self._original_document = value
+        self._original_input = None
 
     def set_up_pause_transmitter(self):
         """ intercept ctrl-C (keyboard interrupt) and redefine as "pause" command """
@@ -124,7 +181,6 @@ class AxiDraw(axidraw.AxiDraw):
 
     def plot_setup(self, svg_input=None, argstrings=None):
         """Python module plot context: Begin plot context & parse SVG file"""
-        file_ok = False
         inkex.localize()
         self.getoptions([] if argstrings is None else argstrings)
 
@@ -132,28 +188,13 @@ class AxiDraw(axidraw.AxiDraw):
         self.old_walk_dist = None # Remove in v 4.0
 
         if svg_input is None:
-            svg_input = plot_utils.trivial_svg
-        try: # Parse input file or SVG string
-            file_ref = open(svg_input, encoding='utf8')
-            parse_ref = etree.XMLParser(huge_tree=True)
-            self.document = etree.parse(file_ref, parser=parse_ref)
-            self.original_document = copy.deepcopy(self.document)
-            file_ref.close()
-            file_ok = True
-        except IOError:
-            pass # It wasn't a file; was it a string?
-        if not file_ok:
-            try:
-                svg_string = svg_input.encode('utf8') # Need consistent encoding.
-                parse_ref = etree.XMLParser(huge_tree=True, encoding='utf8')
-                self.document = etree.ElementTree(etree.fromstring(svg_string, parser=parse_ref))
-                self.original_document = copy.deepcopy(self.document)
-                file_ok = True
-            except:
-                logger.error("Unable to open SVG input file.")
-                raise RuntimeError("Unable to open SVG input file.")
-        if file_ok:
-            self.getdocids()
+            svg_input = TRIVIAL_SVG_BYTES # Parsed directly from bytes, in C
+        svg_source = read_svg_source(svg_input)
+        self.document = parse_svg(svg_source)
+        # Keep only the source of the unmodified copy; see original_document.
+        self.original_document = None
+        self._original_input = svg_source
+        self.getdocids()
         # self.suppress_standard_output_stream()
 
     def plot_run(self, output=False):
@@ -249,12 +290,18 @@ class AxiDraw(axidraw.AxiDraw):
         self.options.preview = False
         self.options.mode = "interactive"
         self.plot_status.secondary = False
+        self._interactive_ok = True
 
     def _verify_interactive(self, verify_connection=False):
         '''
             Check that we are in interactive API context.
             Optionally, check if we are connected as well, and throw an error if not.
         '''
+        # Fast path for the turtle API: no exception handling needed once interactive()
+        # has run and the options are known to exist.
+        if self._interactive_ok and self.options.mode == "interactive" and\
+                (self.connected or not verify_connection):
+            return True
         interactive = False
         try:
             if self.options.mode == "interactive":
@@ -306,30 +353,33 @@ class AxiDraw(axidraw.AxiDraw):
         if not self._verify_interactive(True):
             return
 
-        if self.options.units == 1 : # If using centimeter units
-            x_value = x_value / 2.54
-            y_value = y_value / 2.54
-        if self.options.units == 2: # If using millimeter units
-            x_value = x_value / 25.4
-            y_value = y_value / 25.4
+        divisor = UNIT_DIVISORS.get(self.options.units)
+        if divisor: # If using centimeter or millimeter units
+            x_value = x_value / divisor
+            y_value = y_value / divisor
         if relative:
             x_value = self.pen.turtle.xpos + x_value
             y_value = self.pen.turtle.ypos + y_value
 
-        # Snap interactive movement to travel bounds, with modest tolerance:
-        if math.isclose(x_value, self.bounds[0][0], abs_tol=2e-9):
-            x_value = self.bounds[0][0] # x_bounds_min
-        if math.isclose(x_value,  self.bounds[1][0], abs_tol=2e-9):
-            x_value = self.bounds[1][0] # x_bounds_max
-        if math.isclose(y_value, self.bounds[0][1], abs_tol=2e-9):
-            y_value = self.bounds[0][1] # y_bounds_min
-        if math.isclose(y_value, self.bounds[1][1], abs_tol=2e-9):
-            y_value = self.bounds[1][1] # y_bounds_max
-
-        turtle = [self.pen.turtle.xpos, self.pen.turtle.ypos]
-        target = [x_value, y_value]
-        segment = [turtle, target]
-        accept, seg = plot_utils.clip_segment(segment, self.bounds)
+        # Snap interactive movement to travel bounds, with modest tolerance. These are
+        # the windows of math.isclose(value, bound, abs_tol=2e-9) with its default
+        # rel_tol of 1e-9, as plain comparisons: near-zero minimum bounds get the
+        # absolute tolerance; positive maximum bounds may get the relative one.
+        (x_min, y_min), (x_max, y_max) = self.bounds
+        if -2e-9 <= x_value - x_min <= 2e-9:
+            x_value = x_min
+        tolerance = max(2e-9, 1e-9 * x_max)
+        if -tolerance <= x_value - x_max <= tolerance:
+            x_value = x_max
+        if -2e-9 <= y_value - y_min <= 2e-9:
+            y_value = y_min
+        tolerance = max(2e-9, 1e-9 * y_max)
+        if -tolerance <= y_value - y_max <= tolerance:
+            y_value = y_max
+
+        turtle = (self.pen.turtle.xpos, self.pen.turtle.ypos)
+        target = (x_value, y_value)
+        accept, seg = plot_utils.clip_segment((turtle, target), self.bounds)
 
         if accept and self.plot_status.port: # Segment is at least partially within bounds
             if not plot_utils.points_near(seg[0], turtle, 1e-9): # if initial point clipped
@@ -370,10 +420,9 @@ class AxiDraw(axidraw.AxiDraw):
             return # At least two vertices are required.
         if self.plot_status.stopped: # If this plot is already stopped
             return
-        if self.options.units == 1 : # Centimeter units
-            scaled_vertices = [[vertex[0] / 2.54, vertex[1] / 2.54] for vertex in vertex_list]
-        elif self.options.units == 2: # Millimeter units
-            scaled_vertices = [[vertex[0] / 25.4, vertex[1] / 25.4] for vertex in vertex_list]
+        divisor = UNIT_DIVISORS.get(self.options.units)
+        if divisor: # Centimeter or millimeter units
+            scaled_vertices = [[x / divisor, y / divisor] for x, y in vertex_list]
         else: # Assume self.options.units == 0; use default inch units
             scaled_vertices = vertex_list
         new_path = path_objects.PathItem()
@@ -485,12 +534,14 @@ class AxiDraw(axidraw.AxiDraw):
         '''Interactive context: Low-level USB query'''
         if not self._verify_interactive(True):
             return None
+        self.motor_state = None # Arbitrary EBB commands may change the motor state
         return ebb_serial.query(self.plot_status.port, query).strip()
 
     def usb_command(self, command):
         '''Interactive context: Low-level USB command; use with great care '''
         if not self._verify_interactive(True):
             return
+        self.motor_state = None # Arbitrary EBB commands may change the motor state
         ebb_serial.command(self.plot_status.port, command)
 
     def block(self):
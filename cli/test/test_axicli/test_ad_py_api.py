@@ -1,10 +1,17 @@
 from distutils.version import StrictVersion
 import logging
+import os
+import pathlib
+import shutil
+import tempfile
 import time
 import unittest
 
 from mock import ANY, MagicMock, patch
 
+from lxml import etree
+
+from ink_extensions import simpletransform
 from pyaxidraw import axidraw
 
 testfile = "test/assets/AxiDraw_trivial.svg"
@@ -35,6 +42,107 @@ class AxiDrawPythonAPITestCase(unittest.TestCase):
         self.assertIsNotNone(ad.original_document)
         self.assertNotEqual(ad.document, ad.original_document) # different objects
 
+    def test_plot_setup_inputs(self):
+        print("test plot_setup input types")
+        with open(testfile, 'rb') as file_ref:
+            svg_bytes = file_ref.read()
+        svg_string = svg_bytes.decode('utf8')
+        for svg_input in (testfile, pathlib.Path(testfile), svg_string, svg_bytes,
+                          bytearray(svg_bytes)):
+            with self.subTest(input_type=type(svg_input).__name__):
+                ad = axidraw.AxiDraw()
+                ad.plot_setup(svg_input)
+                self.assertEqual(ad.document.getroot().get('id'), "svg15158")
+                self.assertEqual(ad.original_document.getroot().get('id'), "svg15158")
+
+    def test_plot_setup_missing_file(self):
+        print("test plot_setup with a nonexistent file")
+        ad = axidraw.AxiDraw()
+        with self.assertRaises(RuntimeError):
+            ad.plot_setup("test/assets/no_such_file.svg")
+
+    def test_original_document_snapshot(self):
+        print("test original_document is unchanged after the input file is rewritten")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            svg_path = os.path.join(temp_dir, "plot.svg")
+            shutil.copyfile(testfile, svg_path)
+            ad = axidraw.AxiDraw()
+            ad.plot_setup(svg_path)
+            with open(svg_path, 'w', encoding='utf8') as file_ref: # Write output back
+                file_ref.write('<svg xmlns="http://www.w3.org/2000/svg" id="rewritten"/>')
+
+            self.assertEqual(ad.original_document.getroot().get('id'), "svg15158")
+            self.assertEqual(etree.tostring(ad.original_document),
+                             etree.tostring(etree.parse(testfile)))
+
+    def test_svg_transform(self):
+        print("test viewBox transform matrix")
+        svg_string = ('<svg xmlns="http://www.w3.org/2000/svg" width="8in" height="4in" '
+                      + 'viewBox="10 20 200 100"><path d="M 20,30 L 60,70" '
+                      + 'style="stroke:#000000"/></svg>')
+        ad = axidraw.AxiDraw()
+        ad.plot_setup(svg_string)
+        ad.options.preview = True
+        ad.plot_run()
+
+        s_x, s_y, o_x, o_y = ad.vb_stash
+        expected = simpletransform.parseTransform(
+            f'scale({s_x},{s_y}) translate({o_x},{o_y})')
+        for row, expected_row in zip(ad.svg_transform, expected):
+            for value, expected_value in zip(row, expected_row):
+                self.assertAlmostEqual(value, expected_value, places=12)
+
+        # The viewBox origin, (10, 20), is at the page origin; 200 units span 8 inches.
+        self.assertAlmostEqual(ad.svg_transform[0][0], 0.04, places=12)
+        self.assertAlmostEqual(ad.svg_transform[1][1], 0.04, places=12)
+        self.assertAlmostEqual(ad.svg_transform[0][0] * 10 + ad.svg_transform[0][2], 0,
+                               places=12)
+        self.assertAlmostEqual(ad.svg_transform[1][1] * 20 + ad.svg_transform[1][2], 0,
+                               places=12)
+
+    @patch.object(axidraw.AxiDraw, "go_to_position")
+    @patch.object(axidraw.AxiDraw, "enable_motors")
+    @patch.object(axidraw.AxiDraw, "query_ebb_voltage")
+    def test_res_home_negative_position(self, m_voltage, m_enable, m_go_to_position):
+        print("test res_home from a negative position")
+        for last_x, last_y in ((-1.0, -2.0), (-1.0, 0.0), (0.0, -2.0), (3.0, -2.0)):
+            ad = axidraw.AxiDraw()
+            ad.plot_status.resume.read = True
+            ad.plot_status.resume.old.last_x = last_x
+            ad.plot_status.resume.old.last_y = last_y
+            with patch.object(ad.pen, "servo_init"), patch.object(ad.pen, "pen_raise"),\
+                    patch.object(axidraw.axidraw.logger, "error") as m_error:
+                self.assertTrue(ad.res_home_mode())
+            self.assertNotIn(((axidraw.axidraw.MSG_AT_HOME,),), m_error.call_args_list)
+        self.assertEqual(m_go_to_position.call_count, 4)
+
+    def test_usb_command_clears_motor_state(self):
+        print("test usb_command forces motors to be re-enabled")
+        ad = axidraw.AxiDraw()
+        ad.interactive()
+        ad.connected = True
+        ad.plot_status.port = MagicMock()
+        with patch.object(axidraw.ebb_motion, "query_enable_motors", return_value=(0, 0))\
+                as m_query, patch.object(axidraw.ebb_motion, "sendEnableMotors") as m_enable,\
+                patch.object(axidraw.ebb_serial, "command"):
+            ad.enable_motors()
+            ad.enable_motors() # Motor state is known; no USB round trip
+            self.assertEqual(m_query.call_count, 1)
+            ad.usb_command("EM,0,0\r") # Raw command may disable the motors
+            ad.enable_motors()
+            self.assertEqual(m_query.call_count, 2)
+            self.assertEqual(m_enable.call_count, 2)
+
+    def test_res_home_at_home(self):
+        print("test res_home when already at Home")
+        ad = axidraw.AxiDraw()
+        ad.plot_status.resume.read = True
+        ad.plot_status.resume.old.last_x = 0.0
+        ad.plot_status.resume.old.last_y = -0.0005
+        with patch.object(axidraw.axidraw.logger, "error") as m_error:
+            self.assertFalse(ad.res_home_mode())
+        m_error.assert_called_once_with(axidraw.axidraw.MSG_AT_HOME)
+
     @patch.object(axidraw.AxiDraw, "get_output")
     @patch.object(axidraw.AxiDraw, "effect")
     def test_plot_run(self, m_effect, m_get_output):
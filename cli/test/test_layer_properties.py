@@ -0,0 +1,51 @@
+import unittest
+
+from axidrawinternal import path_objects
+
+# python -m unittest discover -s test in top-level package dir
+
+# Layer name: (number, pause, skip, delay, speed, height, text)
+LAYER_NAME_CASES = {
+    "1+h50+s30+d200": (1, False, False, 200, 30, 50, ""),
+    "2+H40+S25+D1000": (2, False, False, 1000, 25, 40, ""), # Uppercase keys
+    "007+h050": (7, False, False, None, None, 50, ""),
+    "12": (12, False, False, None, None, None, ""),
+    "+s50": (None, False, False, None, 50, None, ""),
+    "!7+d500": (7, True, False, 500, None, None, ""),
+    "%notes": (None, False, True, None, None, None, "notes"),
+    # Empty values:
+    "3+s+h20": (3, False, False, None, None, 20, ""),
+    "11+h5+s": (11, False, False, None, None, 5, ""),
+    "10+d-5": (10, False, False, None, None, None, ""),
+    # In-range limits and out-of-range values:
+    "9+h0+s1+d1": (9, False, False, 1, 1, 0, ""),
+    "4+s110+h100": (4, False, False, None, 110, 100, ""),
+    "4+h101+s0+d0": (4, False, False, None, None, None, ""),
+    "4+s111": (4, False, False, None, None, None, ""),
+    # Trailing and other text:
+    "5+h30 Outline": (5, False, False, None, None, 30, " Outline"),
+    "5 Outline": (5, False, False, None, None, None, " Outline"),
+    "Outline": (None, False, False, None, None, None, "Outline"),
+    "8+x5": (8, False, False, None, None, None, "+x5"),
+    # Fewer than three characters left are not parsed, and not kept as text:
+    "3+s": (3, False, False, None, None, None, ""),
+    "6+h30ab": (6, False, False, None, None, 30, ""),
+    "6+h30abc": (6, False, False, None, None, 30, "abc"),
+}
+
+class LayerPropertiesTestCase(unittest.TestCase):
+
+    def test_parse(self):
+        for layer_name, expected in LAYER_NAME_CASES.items():
+            with self.subTest(layer_name=layer_name):
+                props = path_objects.LayerProperties()
+                props.parse(layer_name)
+                self.assertEqual((props.number, props.pause, props.skip, props.delay,
+                                  props.speed, props.height, props.text), expected)
+
+    def test_parse_empty(self):
+        for layer_name in (None, ""):
+            props = path_objects.LayerProperties()
+            props.parse(layer_name)
+            self.assertEqual((props.number, props.delay, props.speed, props.height,
+                              props.text), (None, None, None, None, ""))
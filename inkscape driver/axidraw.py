@@ -28,11 +28,9 @@ Requires Python 3.8 or newer
 
 __version__ = '3.9.7'  # Dated 2024-01-16
 
-import copy
 import gettext
 from importlib import import_module
 import logging
-import math
 import time
 import socket  # for exception handling only
 
@@ -41,9 +39,6 @@ from lxml import etree
 from axidrawinternal.axidraw_options import common_options, versions
 
 from axidrawinternal import path_objects
-from axidrawinternal import digest_svg
-from axidrawinternal import boundsclip
-from axidrawinternal import plot_optimizations
 from axidrawinternal import plot_status
 from axidrawinternal import pen_handling
 from axidrawinternal import plot_warnings
@@ -53,10 +48,6 @@ from axidrawinternal import dripfeed
 from axidrawinternal import preview
 
 from axidrawinternal.plot_utils_import import from_dependency_import # plotink
-simplepath = from_dependency_import('ink_extensions.simplepath')
-simplestyle = from_dependency_import('ink_extensions.simplestyle')
-cubicsuperpath = from_dependency_import('ink_extensions.cubicsuperpath')
-simpletransform = from_dependency_import('ink_extensions.simpletransform')
 inkex = from_dependency_import('ink_extensions.inkex')
 exit_status = from_dependency_import('ink_extensions_utils.exit_status')
 message = from_dependency_import('ink_extensions_utils.message')
@@ -69,6 +60,45 @@ urllib3 = from_dependency_import('urllib3') # for exception handling only
 
 logger = logging.getLogger(__name__)
 
+# Names of the travel limit parameters for each AxiDraw model; other models use default.
+MODEL_TRAVEL = {2: ('x_travel_V3A3', 'y_travel_V3A3'),
+                3: ('x_travel_V3XLX', 'y_travel_V3XLX'),
+                4: ('x_travel_MiniKit', 'y_travel_MiniKit'),
+                5: ('x_travel_SEA1', 'y_travel_SEA1'),
+                6: ('x_travel_SEA2', 'y_travel_SEA2'),
+                7: ('x_travel_V3B6', 'y_travel_V3B6')}
+
+# Allowed ranges of numeric options, (name, min, max), enforced in update_options:
+OPTION_LIMITS = (('pen_pos_up', 0, 100),
+                 ('pen_pos_down', 0, 100),
+                 ('pen_rate_raise', 1, 200),
+                 ('pen_rate_lower', 1, 200),
+                 ('speed_pendown', 1, 110),
+                 ('speed_penup', 1, 200),
+                 ('accel', 1, 110))
+
+# Compiled XPath to find AxiDraw (and legacy) data elements, for the strip_data command
+STRIP_DATA_XPATH = etree.XPath("//*[self::svg:WCB or self::svg:MergeData or " +
+                               "self::svg:plotdata or self::svg:eggbot]", namespaces=inkex.NSS)
+
+# User-facing messages, translated once at import:
+MSG_STRIP_DATA = gettext.gettext("All AxiDraw data has been removed from this SVG file.")
+MSG_NO_NAMES = gettext.gettext("No named AxiDraw units located.\n")
+MSG_LIST_NAMES = gettext.gettext("List of attached AxiDraw units:")
+MSG_NO_RESUME = gettext.gettext("No in-progress plot data found in file; unable to resume.")
+MSG_NO_RESUME_HOME = gettext.gettext("No resume data found; unable to return Home.")
+MSG_AT_HOME = gettext.gettext("Unable to move to Home. (Is the AxiDraw already at Home?)")
+MSG_BOOTLOAD = gettext.gettext("Entering bootloader mode for firmware programming.\n" +
+                               "To resume normal operation, you will need to first\n" +
+                               "disconnect the AxiDraw from both USB and power.")
+MSG_NO_NICKNAME = gettext.gettext("Error; unable to read nickname.\n")
+MSG_BAD_DIMENSIONS = (gettext.gettext('This document does not have valid dimensions.'),
+    gettext.gettext('The page size should be in either millimeters (mm) or inches (in).\r\r'),
+    gettext.gettext('Consider starting with the Letter landscape or '),
+    gettext.gettext('the A4 landscape template.\r\r'),
+    gettext.gettext('The page size may also be set in Inkscape,\r'),
+    gettext.gettext('using File > Document Properties.'))
+
 class AxiDraw(inkex.Effect):
     """ Main class for AxiDraw """
 
@@ -96,11 +126,14 @@ class AxiDraw(inkex.Effect):
         self.preview = preview.Preview()
 
         self.spew_debugdata = False # Possibly add this as a PlotStatus variable
+        # Lines of the text_out and error_out logs; joined only when read:
+        self.log_lines = {'text_out': [''], 'error_out': ['']}
         self.set_defaults()
         self.digest = None
         self.vb_stash = [1, 1, 0, 0] # Viewbox storage
         self.bounds = [[0, 0], [0, 0]]
         self.connected = False # Python API variable.
+        self.motor_state = None # (port, microstep mode) last set by enable_motors()
 
         self.plot_status.secondary = False
         self.user_message_fun = user_message_fun
@@ -112,6 +145,24 @@ class AxiDraw(inkex.Effect):
         if self.spew_debugdata:
             logger.setLevel(logging.DEBUG) # by default level is INFO
 
+    @property
+    def text_out(self):
+        """ Text log for basic communication messages """
+        return "\n".join(self.log_lines['text_out'])
+
+    @text_out.setter
+    def text_out(self, value):
+        self.log_lines['text_out'] = [value]
+
+    @property
+    def error_out(self):
+        """ Text log for significant errors """
+        return "\n".join(self.log_lines['error_out'])
+
+    @error_out.setter
+    def error_out(self, value):
+        self.log_lines['error_out'] = [value]
+
     def set_up_pause_receiver(self, software_pause_event):
         """ use a multiprocessing.Event/threading.Event to communicate a
         keyboard interrupt (ctrl-C) to pause the AxiDraw """
@@ -121,6 +172,13 @@ class AxiDraw(inkex.Effect):
         """pause receiver"""
         return hasattr(self, "_software_pause_event") and self._software_pause_event.is_set()
 
+    def wait_pause_request(self, timeout):
+        """ Sleep for up to timeout seconds, waking early on a software pause request """
+        if hasattr(self, "_software_pause_event"):
+            self._software_pause_event.wait(timeout)
+        else:
+            time.sleep(timeout)
+
     def set_secondary(self, suppress_standard_out=True):
         """ If a "secondary" AxiDraw called by axidraw_control """
         self.plot_status.secondary = True
@@ -176,27 +234,10 @@ class AxiDraw(inkex.Effect):
         y_bounds_min = 0.0
 
         # Physical travel bounds, based on AxiDraw model:
-        if self.options.model == 2:
-            x_bounds_max = self.params.x_travel_V3A3
-            y_bounds_max = self.params.y_travel_V3A3
-        elif self.options.model == 3:
-            x_bounds_max = self.params.x_travel_V3XLX
-            y_bounds_max = self.params.y_travel_V3XLX
-        elif self.options.model == 4:
-            x_bounds_max = self.params.x_travel_MiniKit
-            y_bounds_max = self.params.y_travel_MiniKit
-        elif self.options.model == 5:
-            x_bounds_max = self.params.x_travel_SEA1
-            y_bounds_max = self.params.y_travel_SEA1
-        elif self.options.model == 6:
-            x_bounds_max = self.params.x_travel_SEA2
-            y_bounds_max = self.params.y_travel_SEA2
-        elif self.options.model == 7:
-            x_bounds_max = self.params.x_travel_V3B6
-            y_bounds_max = self.params.y_travel_V3B6
-        else:
-            x_bounds_max = self.params.x_travel_default
-            y_bounds_max = self.params.y_travel_default
+        x_name, y_name = MODEL_TRAVEL.get(self.options.model,
+                                          ('x_travel_default', 'y_travel_default'))
+        x_bounds_max = getattr(self.params, x_name)
+        y_bounds_max = getattr(self.params, y_name)
 
         self.bounds = [[x_bounds_min - 1e-9, y_bounds_min - 1e-9],
                        [x_bounds_max + 1e-9, y_bounds_max + 1e-9]]
@@ -204,22 +245,23 @@ class AxiDraw(inkex.Effect):
         # Speeds in inches/second:
         self.speed_pendown = self.params.speed_pendown * self.params.speed_lim_xy_hr / 110.0
         self.speed_penup = self.params.speed_penup * self.params.speed_lim_xy_hr / 110.0
+        # Acceleration rates in inches/second^2:
+        self.accel_pendown = self.params.accel_rate * self.params.accel / 100.0
+        self.accel_penup = self.params.accel_rate_pu * self.params.accel / 100.0
 
         # Input limit checking; constrain input values and prevent zero speeds:
-        self.options.pen_pos_up = plot_utils.constrainLimits(self.options.pen_pos_up, 0, 100)
-        self.options.pen_pos_down = plot_utils.constrainLimits(self.options.pen_pos_down, 0, 100)
-        self.options.pen_rate_raise = \
-            plot_utils.constrainLimits(self.options.pen_rate_raise, 1, 200)
-        self.options.pen_rate_lower = \
-            plot_utils.constrainLimits(self.options.pen_rate_lower, 1, 200)
-        self.options.speed_pendown = plot_utils.constrainLimits(self.options.speed_pendown, 1, 110)
-        self.options.speed_penup = plot_utils.constrainLimits(self.options.speed_penup, 1, 200)
-        self.options.accel = plot_utils.constrainLimits(self.options.accel, 1, 110)
+        for name, min_value, max_value in OPTION_LIMITS:
+            value = getattr(self.options, name)
+            if value < min_value:
+                setattr(self.options, name, min_value)
+            elif value > max_value:
+                setattr(self.options, name, max_value)
 
 
     def effect(self):
         """Main entry point: check to see which mode/tab is selected, and act accordingly."""
         self.start_time = time.time()
+        options = self.options # Local alias; options are read many times below
 
         try:
             self.plot_status.secondary
@@ -229,6 +271,14 @@ class AxiDraw(inkex.Effect):
         self.text_out = '' # Text log for basic communication messages
         self.error_out = '' # Text log for significant errors
 
+        options.mode = options.mode.strip("\"") # Input sanitization
+        if options.mode in ("options", "timing"):
+            return # No initialization needed for these modes
+        if options.mode == "version":
+            # Return the version of _this python script_.
+            self.user_message_fun(self.version_string)
+            return
+
         self.plot_status.stats.reset() # Reset plot duration and distance statistics
 
         self.doc_units = "in"
@@ -247,95 +297,109 @@ class AxiDraw(inkex.Effect):
 
         self.update_options()
 
-        self.options.mode = self.options.mode.strip("\"") # Input sanitization
-        self.options.setup_type = self.options.setup_type.strip("\"")
-        self.options.manual_cmd = self.options.manual_cmd.strip("\"")
-        self.options.resume_type = self.options.resume_type.strip("\"")
-        self.options.page_delay = max(self.options.page_delay, 0)
+        options.setup_type = options.setup_type.strip("\"")
+        options.manual_cmd = options.manual_cmd.strip("\"")
+        options.resume_type = options.resume_type.strip("\"")
+        options.page_delay = max(options.page_delay, 0)
 
         try:
             self.called_externally
         except AttributeError:
             self.called_externally = False
 
-        if self.options.mode == "options":
-            return
-        if self.options.mode == "timing":
-            return
-        if self.options.mode == "version":
-            # Return the version of _this python script_.
-            self.user_message_fun(self.version_string)
-            return
-        if self.options.mode == "manual":
-            if self.options.manual_cmd == "none":
+        if options.mode == "manual":
+            if options.manual_cmd == "none":
                 return  # No option selected. Do nothing and return no error.
-            if self.options.manual_cmd == "strip_data":
+            if options.manual_cmd == "strip_data":
                 self.svg = self.document.getroot()
-                for slug in ['WCB', 'MergeData', 'plotdata', 'eggbot']:
-                    for node in self.svg.xpath('//svg:' + slug, namespaces=inkex.NSS):
-                        self.svg.remove(node)
-                self.user_message_fun(gettext.gettext(\
-                    "All AxiDraw data has been removed from this SVG file."))
+                for node in reversed(STRIP_DATA_XPATH(self.svg)):
+                    node.getparent().remove(node)
+                self.user_message_fun(MSG_STRIP_DATA)
                 return
-            if self.options.manual_cmd in ("res_read", "res_adj_in", "res_adj_mm"):
+            if options.manual_cmd in ("res_read", "res_adj_in", "res_adj_mm"):
                 self.svg = self.document.getroot()
                 self.user_message_fun(self.plot_status.resume.manage_offset(self))
                 self.res_dist = max(self.plot_status.resume.new.pause_dist*25.4, 0) # Python API
                 return
-            if self.options.manual_cmd == "list_names": # Run before regular serial connection!
+            if options.manual_cmd == "list_names": # Run before regular serial connection!
                 self.name_list = ebb_serial.list_named_ebbs() # Variable available for python API
                 if not self.name_list:
-                    self.user_message_fun(gettext.gettext("No named AxiDraw units located.\n"))
+                    self.user_message_fun(MSG_NO_NAMES)
                 else:
-                    self.user_message_fun(gettext.gettext("List of attached AxiDraw units:"))
+                    self.user_message_fun(MSG_LIST_NAMES)
                     for detected_ebb in self.name_list:
                         self.user_message_fun(detected_ebb)
                 return
 
-        if self.options.mode == "resume":
-            if self.options.resume_type == "home":
-                self.options.mode = "res_home"
+        if options.mode == "resume":
+            if options.resume_type == "home":
+                options.mode = "res_home"
             else:
-                self.options.mode = "res_plot"
-                self.options.copies = 1
+                options.mode = "res_plot"
+                options.copies = 1
 
-        if self.options.mode == "setup":
+        if options.mode == "setup":
             # setup mode -> either align, toggle, or cycle modes.
-            self.options.mode = self.options.setup_type
+            options.mode = options.setup_type
 
-        if self.options.digest > 1: # Generate digest only; do not run plot or preview
-            self.options.preview = True # Disable serial communication; restrict certain functions
+        if options.digest > 1: # Generate digest only; do not run plot or preview
+            options.preview = True # Disable serial communication; restrict certain functions
 
-        if not self.options.preview:
+        if not options.preview:
             self.serial_connect()
             self.plot_status.resume.clear_button(self) # Query button to clear its state
 
-        if self.options.mode == "sysinfo":
+        if options.mode == "sysinfo":
             versions.report_version_info(self.plot_status, self.params.check_updates,
-                                         self.version_string, self.options.preview,
+                                         self.version_string, options.preview,
                                          self.user_message_fun)
 
-        if self.plot_status.port is None and not self.options.preview:
+        if self.plot_status.port is None and not options.preview:
             return # unable to connect to axidraw
 
-        if self.options.mode in ('align', 'toggle', 'cycle'):
+        if options.mode in ('align', 'toggle', 'cycle'):
             self.setup_command()
             self.warnings.report(self.called_externally, self.user_message_fun) # print warnings
             return
 
-        if self.options.mode == "manual":
+        if options.mode == "manual":
             self.manual_command() # Handle manual commands that use both power and usb.
             self.warnings.report(self.called_externally, self.user_message_fun) # print warnings
             return
 
         self.svg = self.document.getroot()
         self.plot_status.resume.update_needed = False
-        self.plot_status.resume.new.model = self.options.model # Save model in file
-
-        if self.options.mode in ("plot", "layers", "res_plot", "res_home"):
+        self.plot_status.resume.new.model = options.model # Save model in file
+
+        # Modes that plot from, or return home based upon, the SVG document:
+        mode_handler = {"plot": self.plot_mode,
+                        "layers": self.plot_mode,
+                        "res_plot": self.plot_mode,
+                        "res_home": self.res_home_mode}.get(options.mode)
+        if mode_handler is not None:
             # Read saved data from SVG file, including plob version information
             self.plot_status.resume.read_from_svg(self.svg)
+            if not mode_handler():
+                return
 
+        if self.plot_status.resume.update_needed:
+            self.plot_status.resume.new.last_x = self.pen.phys.xpos
+            self.plot_status.resume.new.last_y = self.pen.phys.ypos
+            if options.digest: # i.e., if options.digest > 0
+                self.plot_status.resume.new.plob_version = str(path_objects.PLOB_VERSION)
+            self.plot_status.resume.write_to_svg(self.svg)
+        if self.plot_status.port is not None:
+            ebb_motion.doTimedPause(self.plot_status.port, 10, False) # Final timed motion command
+            if options.port is None:  # Do not close serial port if it was opened externally.
+                self.disconnect()
+        self.warnings.report(self.called_externally, self.user_message_fun) # print warnings
+
+
+    def plot_mode(self):
+        """
+        Plot the document, or selected layers of it, or resume a paused plot;
+        in plot, layers, and res_plot modes. Return False if effect should exit immediately.
+        """
         if self.options.mode == "res_plot":  # Initialization for resuming plots
             if self.plot_status.resume.old.pause_dist >= 0:
                 self.pen.phys.xpos = self.plot_status.resume.old.last_x
@@ -343,103 +407,95 @@ class AxiDraw(inkex.Effect):
                 self.plot_status.resume.new.rand_seed = self.plot_status.resume.old.rand_seed
                 self.plot_status.resume.new.layer = self.plot_status.resume.old.layer
             else:
-                logger.error(gettext.gettext(\
-                    "No in-progress plot data found in file; unable to resume."))
-                return
+                logger.error(MSG_NO_RESUME)
+                return False
 
-        if self.options.mode in ("plot", "layers", "res_plot"):
-            self.plot_status.copies_to_plot = self.options.copies
-            if self.plot_status.copies_to_plot == 0: # Special case: Continuous copies selected
-                self.plot_status.copies_to_plot = -1 # Flag for continuous copies
+        self.plot_status.copies_to_plot = self.options.copies
+        if self.plot_status.copies_to_plot == 0: # Special case: Continuous copies selected
+            self.plot_status.copies_to_plot = -1 # Flag for continuous copies
 
-            if self.options.preview and not self.options.random_start:
-                # Special preview case: Without randomizing, pages have identical print time:
-                self.plot_status.copies_to_plot = 1
+        if self.options.preview and not self.options.random_start:
+            # Special preview case: Without randomizing, pages have identical print time:
+            self.plot_status.copies_to_plot = 1
 
-            if self.options.mode == "plot":
-                self.plot_status.resume.new.layer = -1  # Plot all layers
-            if self.options.mode == "layers":
-                self.plot_status.resume.new.layer = self.options.layer
+        if self.options.mode == "plot":
+            self.plot_status.resume.new.layer = -1  # Plot all layers
+        if self.options.mode == "layers":
+            self.plot_status.resume.new.layer = self.options.layer
 
-            # Parse & digest SVG document, perform initial optimizations, prepare to resume:
-            if not self.prepare_document():
-                return
+        # Parse & digest SVG document, perform initial optimizations, prepare to resume:
+        if not self.prepare_document():
+            return False
 
-            if self.options.digest > 1: # Generate digest only; do not run plot or preview
-                self.plot_cleanup()     # Revert document to save plob & print time elapsed
-                self.plot_status.resume.new.plob_version = str(path_objects.PLOB_VERSION)
-                self.plot_status.resume.write_to_svg(self.svg)
-                self.warnings.report(False, self.user_message_fun) # print warnings
-                return
+        if self.options.digest > 1: # Generate digest only; do not run plot or preview
+            self.plot_cleanup()     # Revert document to save plob & print time elapsed
+            self.plot_status.resume.new.plob_version = str(path_objects.PLOB_VERSION)
+            self.plot_status.resume.write_to_svg(self.svg)
+            self.warnings.report(False, self.user_message_fun) # print warnings
+            return False
 
-            if self.options.mode == "res_plot": # Crop digest up to when the plot resumes:
-                self.digest.crop(self.plot_status.resume.old.pause_dist)
+        if self.options.mode == "res_plot": # Crop digest up to when the plot resumes:
+            self.digest.crop(self.plot_status.resume.old.pause_dist)
 
-            # CLI PROGRESS BAR: SET UP DRY RUN TO ESTIMATE PLOT LENGTH & TIME
-            if self.plot_status.progress.review(self.plot_status, self.options):
-                self.plot_document() # "Dry run": Estimate plot length & time
+        # CLI PROGRESS BAR: SET UP DRY RUN TO ESTIMATE PLOT LENGTH & TIME
+        if self.plot_status.progress.review(self.plot_status, self.options):
+            self.plot_document() # "Dry run": Estimate plot length & time
 
-                self.user_message_fun(self.plot_status.progress.restore(self))
-                self.plot_status.stats.reset() # Reset plot duration and distance statistics
+            self.user_message_fun(self.plot_status.progress.restore(self))
+            self.plot_status.stats.reset() # Reset plot duration and distance statistics
 
-            if self.options.mode == "res_plot":
-                self.pen.phys.xpos = self.plot_status.resume.old.last_x
-                self.pen.phys.ypos = self.plot_status.resume.old.last_y
-
-                # Update so that if the plot is paused, we can resume again
-                self.plot_status.stats.down_travel_inch = self.plot_status.resume.old.pause_dist
-
-            first_copy = True
-            while self.plot_status.copies_to_plot != 0:
+        if self.options.mode == "res_plot":
+            self.pen.phys.xpos = self.plot_status.resume.old.last_x
+            self.pen.phys.ypos = self.plot_status.resume.old.last_y
 
-                self.preview.reset() # Clear preview data before starting each plot
-                self.plot_status.resume.update_needed = True
-                self.plot_status.copies_to_plot -= 1
+            # Update so that if the plot is paused, we can resume again
+            self.plot_status.stats.down_travel_inch = self.plot_status.resume.old.pause_dist
 
-                if first_copy:
-                    first_copy = False
-                else:
-                    self.plot_status.stats.next_page() # Update distance stats for next page
-                    if self.options.random_start:
-                        self.randomize_optimize() # Only need to re-optimize if randomizing
-                self.plot_document()
-                dripfeed.page_layer_delay(self, between_pages=True) # Delay between pages
+        self.plot_copies()
+        self.plot_cleanup() # Revert document, print time reports, send webhooks
+        return True
 
-            self.plot_cleanup() # Revert document, print time reports, send webhooks
+    def plot_copies(self):
+        """ Plot the prepared digest, once per copy, with page delays between copies """
+        first_copy = True
+        while self.plot_status.copies_to_plot != 0:
 
-        elif self.options.mode  == "res_home":
-            self.plot_status.resume.copy_old()
-            self.pen.phys.xpos = self.plot_status.resume.old.last_x
-            self.pen.phys.ypos = self.plot_status.resume.old.last_y
+            self.preview.reset() # Clear preview data before starting each plot
             self.plot_status.resume.update_needed = True
+            self.plot_status.copies_to_plot -= 1
 
-            if not self.plot_status.resume.read:
-                logger.error(gettext.gettext("No resume data found; unable to return Home."))
-                return
-            if (math.fabs(self.pen.phys.xpos < 0.001) and
-                    math.fabs(self.pen.phys.ypos < 0.001)):
-                logger.error(gettext.gettext(\
-                    "Unable to move to Home. (Is the AxiDraw already at Home?)"))
-                return
+            if first_copy:
+                first_copy = False
+            else:
+                self.plot_status.stats.next_page() # Update distance stats for next page
+                if self.options.random_start:
+                    self.randomize_optimize() # Only need to re-optimize if randomizing
+            self.plot_document()
+            dripfeed.page_layer_delay(self, between_pages=True) # Delay between pages
 
-            self.query_ebb_voltage()
-            self.pen.servo_init(self)
-            self.pen.pen_raise(self)
-            self.enable_motors()
-            self.go_to_position(self.params.start_pos_x, self.params.start_pos_y)
+    def res_home_mode(self):
+        """
+        Return home from a paused plot, in res_home mode.
+        Return False if effect should exit immediately.
+        """
+        self.plot_status.resume.copy_old()
+        self.pen.phys.xpos = self.plot_status.resume.old.last_x
+        self.pen.phys.ypos = self.plot_status.resume.old.last_y
+        self.plot_status.resume.update_needed = True
 
-        if self.plot_status.resume.update_needed:
-            self.plot_status.resume.new.last_x = self.pen.phys.xpos
-            self.plot_status.resume.new.last_y = self.pen.phys.ypos
-            if self.options.digest: # i.e., if self.options.digest > 0
-                self.plot_status.resume.new.plob_version = str(path_objects.PLOB_VERSION)
-            self.plot_status.resume.write_to_svg(self.svg)
-        if self.plot_status.port is not None:
-            ebb_motion.doTimedPause(self.plot_status.port, 10, False) # Final timed motion command
-            if self.options.port is None:  # Do not close serial port if it was opened externally.
-                self.disconnect()
-        self.warnings.report(self.called_externally, self.user_message_fun) # print warnings
+        if not self.plot_status.resume.read:
+            logger.error(MSG_NO_RESUME_HOME)
+            return False
+        if abs(self.pen.phys.xpos) < 0.001 and abs(self.pen.phys.ypos) < 0.001:
+            logger.error(MSG_AT_HOME)
+            return False
 
+        self.query_ebb_voltage()
+        self.pen.servo_init(self)
+        self.pen.pen_raise(self)
+        self.enable_motors()
+        self.go_to_position(self.params.start_pos_x, self.params.start_pos_y)
+        return True
 
     def setup_command(self):
         """ Commands from the setup modes. Need power and USB, but not SVG file. """
@@ -457,6 +513,7 @@ class AxiDraw(inkex.Effect):
         if self.options.mode == "align":
             self.pen.pen_raise(self)
             ebb_motion.sendDisableMotors(self.plot_status.port, False)
+            self.motor_state = None
         elif self.options.mode == "cycle":
             self.pen.cycle(self)
         # Note that "toggle" mode is handled within self.pen.servo_init(self)
@@ -477,10 +534,7 @@ class AxiDraw(inkex.Effect):
         if self.options.manual_cmd == "bootload":
             success = ebb_serial.bootload(self.plot_status.port)
             if success:
-                self.user_message_fun(
-                    gettext.gettext("Entering bootloader mode for firmware programming.\n" +
-                                    "To resume normal operation, you will need to first\n" +
-                                    "disconnect the AxiDraw from both USB and power."))
+                self.user_message_fun(MSG_BOOTLOAD)
                 self.disconnect() # Disconnect from AxiDraw; end serial session
             else:
                 logger.error('Failed while trying to enter bootloader.')
@@ -489,7 +543,7 @@ class AxiDraw(inkex.Effect):
         if self.options.manual_cmd == "read_name":
             name_string = ebb_serial.query_nickname(self.plot_status.port)
             if name_string is None:
-                logger.error(gettext.gettext("Error; unable to read nickname.\n"))
+                logger.error(MSG_NO_NICKNAME)
             else:
                 self.user_message_fun(name_string)
             return
@@ -526,6 +580,7 @@ class AxiDraw(inkex.Effect):
             self.enable_motors()
         elif self.options.manual_cmd == "disable_xy":
             ebb_motion.sendDisableMotors(self.plot_status.port, False)
+            self.motor_state = None
         else:  # walk motors or move home cases:
             self.pen.servo_init(self)
             self.enable_motors()  # Set plotting resolution
@@ -565,23 +620,15 @@ class AxiDraw(inkex.Effect):
         Prepare the SVG document for plotting: Create the plot digest, join nearby ends,
         and perform supersampling. If not using randomization, then optimize the digest as well.
         """
+        # Modules used only when preparing documents for plotting; import when needed.
+        import copy
+        from axidrawinternal import digest_svg, boundsclip, plot_optimizations
+
         if not self.get_doc_props():
-            logger.error(gettext.gettext('This document does not have valid dimensions.'))
-            logger.error(gettext.gettext(
-                'The page size should be in either millimeters (mm) or inches (in).\r\r'))
-            logger.error(gettext.gettext(
-                'Consider starting with the Letter landscape or '))
-            logger.error(gettext.gettext('the A4 landscape template.\r\r'))
-            logger.error(gettext.gettext('The page size may also be set in Inkscape,\r'))
-            logger.error(gettext.gettext('using File > Document Properties.'))
+            for error_text in MSG_BAD_DIMENSIONS:
+                logger.error(error_text)
             return False
 
-        if not hasattr(self, 'backup_original'):
-            self.backup_original = copy.deepcopy(self.document)
-
-        # Modifications to SVG -- including re-ordering and text substitution
-        #   may be made at this point, and will not be preserved.
-
         v_b = self.svg.get('viewBox')
         if v_b:
             p_a_r = self.svg.get('preserveAspectRatio')
@@ -593,14 +640,23 @@ class AxiDraw(inkex.Effect):
             o_y = 0.0
         self.vb_stash = s_x, s_y, o_x, o_y
 
-        # Initial transform of document is based on viewbox, if present:
-        self.svg_transform = simpletransform.parseTransform(\
-                f'scale({s_x:.6E},{s_y:.6E}) translate({o_x:.6E},{o_y:.6E})')
+        # Initial transform of document is based on viewbox, if present.
+        # Matrix equivalent to transform "scale(s_x,s_y) translate(o_x,o_y)":
+        self.svg_transform = [[s_x, 0.0, s_x * o_x], [0.0, s_y, s_y * o_y]]
 
         valid_plob = False
         if self.plot_status.resume.old.plob_version:
             logger.debug('Checking Plob')
             valid_plob = digest_svg.verify_plob(self.svg, self.options.model)
+
+        # When saving digest output, randomize_optimize() backs up the plob instead;
+        #   skip copying the full document unless the input is already a valid plob.
+        if not hasattr(self, 'backup_original') and (valid_plob or not self.options.digest):
+            self.backup_original = copy.deepcopy(self.document)
+
+        # Modifications to SVG -- including re-ordering and text substitution
+        #   may be made at this point, and will not be preserved.
+
         if valid_plob:
             logger.debug('Valid plob found; skipping standard pre-processing.')
             self.digest = path_objects.DocDigest()
@@ -678,6 +734,7 @@ class AxiDraw(inkex.Effect):
 
     def randomize_optimize(self, first_copy=False):
         """ Randomize start points & perform reordering """
+        from axidrawinternal import plot_optimizations
 
         if self.plot_status.resume.new.plob_version != "n/a":
             return # Working from valid plob; do not perform any optimizations.
@@ -692,7 +749,7 @@ class AxiDraw(inkex.Effect):
             plot_optimizations.reorder(self.digest, allow_reverse)
 
         if first_copy and self.options.digest: # Will return Plob, not full SVG; back it up here.
-            self.backup_original = copy.deepcopy(self.digest.to_plob())
+            self.backup_original = self.digest.to_plob() # to_plob() builds a new tree
 
 
     def plot_document(self):
@@ -737,7 +794,9 @@ class AxiDraw(inkex.Effect):
         Doing so allows us to use routines that alter the SVG prior to this point,
             e.g., plot re-ordering for speed or font substitutions.
         """
-        self.document = copy.deepcopy(self.backup_original)
+        # Restore the backup itself; it is taken afresh by prepare_document for each run.
+        self.document = self.backup_original
+        del self.backup_original
 
         try: # Handle cases: backup_original May be etree Element or ElementTree
             self.svg = self.document.getroot() # For ElementTree, get the root
@@ -798,25 +857,31 @@ class AxiDraw(inkex.Effect):
         for layer in digest.layers:
 
             self.pen.end_temp_height(self)
-            old_use_layer_speed = self.use_layer_speed  # A Boolean
-            old_layer_speed_pendown = self.layer_speed_pendown  # Numeric value
             self.pen.pen_raise(self) # Raise pen prior to computing layer properties
 
             if self.options.mode == "layers": # Special case: The plob contains all layers
                 if layer.props.number != self.options.layer: # and is plotted in layers mode.
                     continue # Here, ensure that only certain layers should be printed.
 
+            # Only a layer with its own speed changes the layer speed variables;
+            #   other layers leave them at their defaults, with nothing to restore.
+            layer_speed = layer.props.speed
+            if layer_speed:
+                old_use_layer_speed = self.use_layer_speed  # A Boolean
+                old_layer_speed_pendown = self.layer_speed_pendown  # Numeric value
+
             self.eval_layer_props(layer.props)
 
             for path_item in layer.paths:
                 if self.plot_status.stopped:
                     return
                 self.plot_polyline(path_item.subpaths[0])
-            self.use_layer_speed = old_use_layer_speed # Restore old layer status variables
 
-            if self.layer_speed_pendown != old_layer_speed_pendown:
-                self.layer_speed_pendown = old_layer_speed_pendown
-                self.enable_motors() # Set speed value variables for this layer.
+            if layer_speed: # Restore old layer status variables
+                self.use_layer_speed = old_use_layer_speed
+                if self.layer_speed_pendown != old_layer_speed_pendown:
+                    self.layer_speed_pendown = old_layer_speed_pendown
+                    self.enable_motors() # Set speed value variables for this layer.
             self.pen.end_temp_height(self)
 
     def eval_layer_props(self, layer_props):
@@ -867,11 +932,12 @@ class AxiDraw(inkex.Effect):
 
         self.pen.pen_raise(self) # Raise, if necessary, prior to pen-up travel to first vertex
 
-        for vertex in vertex_list:
-            vertex[0], _t_x = plot_utils.checkLimitsTol(vertex[0], 0, self.bounds[1][0], 2e-9)
-            vertex[1], _t_y = plot_utils.checkLimitsTol(vertex[1], 0, self.bounds[1][1], 2e-9)
-            # if _t_x or _t_y:
-            #     logger.debug('Travel truncated to bounds at plot_polyline.')
+        [x_max, y_max] = self.bounds[1]
+        for vertex in vertex_list: # Truncate motion at travel bounds
+            if not (0 <= vertex[0] <= x_max and 0 <= vertex[1] <= y_max):
+                vertex[0] = min(max(vertex[0], 0), x_max)
+                vertex[1] = min(max(vertex[1], 0), y_max)
+                # logger.debug('Travel truncated to bounds at plot_polyline.')
 
         # Pen up straight move, zero velocity at endpoints, to first vertex location
         self.go_to_position(vertex_list[0][0], vertex_list[0][1])
@@ -957,7 +1023,7 @@ class AxiDraw(inkex.Effect):
 
     def enable_motors(self):
         """
-        Enable motors, set native motor resolution, and set speed scales.
+        Enable motors, set native motor resolution, and set speed scales and acceleration rates.
         The "pen down" speed scale is adjusted by reducing speed when using 8X microstepping or
         disabling aceleration. These factors prevent unexpected dramatic changes in speed when
         turning those two options on and off.
@@ -968,26 +1034,34 @@ class AxiDraw(inkex.Effect):
             local_speed_pendown = self.options.speed_pendown
 
         if self.options.resolution == 1:  # High-resolution ("Super") mode
-            if not self.options.preview:
-                res_1, res_2 = ebb_motion.query_enable_motors(self.plot_status.port, False)
-                if not (res_1 == 1 and res_2 == 1): # Do not re-enable if already enabled
-                    ebb_motion.sendEnableMotors(self.plot_status.port, 1)  # 16X microstepping
+            microstep_mode = 1  # 16X microstepping
             self.step_scale = 2.0 * self.params.native_res_factor
-            self.speed_pendown = local_speed_pendown * self.params.speed_lim_xy_hr / 110.0
-            self.speed_penup = self.options.speed_penup * self.params.speed_lim_xy_hr / 110.0
-            if self.options.const_speed:
-                self.speed_pendown = self.speed_pendown * self.params.const_speed_factor_hr
+            speed_lim_xy = self.params.speed_lim_xy_hr
+            const_speed_factor = self.params.const_speed_factor_hr
         else:  # i.e., self.options.resolution == 2; Low-resolution ("Normal") mode
-            if not self.options.preview:
-                res_1, res_2 = ebb_motion.query_enable_motors(self.plot_status.port, False)
-                if not (res_1 == 2 and res_2 == 2): # Do not re-enable if already enabled
-                    ebb_motion.sendEnableMotors(self.plot_status.port, 2)  # 8X microstepping
+            microstep_mode = 2  # 8X microstepping
             self.step_scale = self.params.native_res_factor
             # Low-res mode: Allow faster pen-up moves. Keep maximum pen-down speed the same.
-            self.speed_penup = self.options.speed_penup * self.params.speed_lim_xy_lr / 110.0
-            self.speed_pendown = local_speed_pendown * self.params.speed_lim_xy_lr / 110.0
-            if self.options.const_speed:
-                self.speed_pendown = self.speed_pendown * self.params.const_speed_factor_lr
+            speed_lim_xy = self.params.speed_lim_xy_lr
+            const_speed_factor = self.params.const_speed_factor_lr
+
+        # Skip the USB round trip if we have already enabled the motors in this mode, on this
+        #   port. Commands that disable the motors clear motor_state, as do the Python API's
+        #   usb_command() and usb_query(), since raw EBB commands may change the motor state.
+        if not self.options.preview and \
+                self.motor_state != (self.plot_status.port, microstep_mode):
+            res_1, res_2 = ebb_motion.query_enable_motors(self.plot_status.port, False)
+            if not (res_1 == microstep_mode and res_2 == microstep_mode):
+                ebb_motion.sendEnableMotors(self.plot_status.port, microstep_mode)
+            self.motor_state = (self.plot_status.port, microstep_mode)
+
+        self.speed_pendown = local_speed_pendown * speed_lim_xy / 110.0
+        self.speed_penup = self.options.speed_penup * speed_lim_xy / 110.0
+        if self.options.const_speed:
+            self.speed_pendown *= const_speed_factor
+        # Acceleration rates, cached here so that motion planning need not recompute them:
+        self.accel_pendown = self.params.accel_rate * self.options.accel / 100.0
+        self.accel_penup = self.params.accel_rate_pu * self.options.accel / 100.0
         # ebb_serial.command(self.plot_status.port, "CU,3,1\r") # EBB 2.8.1+: Enable data-low LED
 
     def query_ebb_voltage(self):
@@ -1032,8 +1106,7 @@ class SecondaryLoggingHandler(logging.Handler):
     def __init__(self, axidraw, log_name, level = logging.NOTSET):
         super().__init__(level=level)
 
-        log = getattr(axidraw, log_name) if hasattr(axidraw, log_name) else ""
-        setattr(axidraw, log_name, log)
+        axidraw.log_lines.setdefault(log_name, [""])
 
         self.axidraw = axidraw
         self.log_name = log_name
@@ -1041,9 +1114,8 @@ class SecondaryLoggingHandler(logging.Handler):
         self.setFormatter(logging.Formatter()) # pass message through unchanged
 
     def emit(self, record):
-        assert(hasattr(self.axidraw, self.log_name))
-        new_log = getattr(self.axidraw, self.log_name) + "\n" + self.format(record)
-        setattr(self.axidraw, self.log_name, new_log)
+        # Append one line, rather than re-copying the whole log string per record
+        self.axidraw.log_lines[self.log_name].append(self.format(record))
 
 class SecondaryErrorHandler(SecondaryLoggingHandler):
     '''Handle logging for "secondary" machines, plotting alongside primary.'''
@@ -140,9 +140,9 @@ class AxiDrawWrapperClass( inkex.Effect ):
 
                 for found_port in ebb_list:
                     logger.info("Found an EBB:")
-                    logger.info(" Port name:   " + found_port[0])	# Port name
-                    logger.info(" Description: " + found_port[1])	# Description
-                    logger.info(" Hardware ID: " + found_port[2])	# Hardware ID
+                    logger.info(" Port name:   %s", found_port[0])	# Port name
+                    logger.info(" Description: %s", found_port[1])	# Description
+                    logger.info(" Hardware ID: %s", found_port[2])	# Hardware ID
                 if len(ebb_list) == 1:
                     logger.info("Found a single AxiDraw via USB.")
                     self.plot_to_axidraw(None, True)
@@ -151,11 +151,11 @@ class AxiDrawWrapperClass( inkex.Effect ):
                         primary_port = ebb_list[0][0]
                     for index, found_port in enumerate(ebb_list):
                         if found_port[0] == primary_port:
-                            logger.info("found_port is primary: " + primary_port)
+                            logger.info("found_port is primary: %s", primary_port)
                             continue # We will launch primary after spawning other processes.
 
                         # Launch subprocess(es) here:
-                        logger.info("Launching subprocess to port: " + found_port[0])
+                        logger.info("Launching subprocess to port: %s", found_port[0])
 
                         if USE_MULTIPROCESSING:
                             process = multiprocessing.Process(target=self.plot_to_axidraw,
@@ -167,7 +167,7 @@ class AxiDrawWrapperClass( inkex.Effect ):
                         process_list.append(process)
                         process.start()
 
-                    logger.info("Plotting to primary: " + primary_port)
+                    logger.info("Plotting to primary: %s", primary_port)
 
                     self.plot_to_axidraw(primary_port, True) # Plot to "primary" AxiDraw
                     for process in process_list:
@@ -27,6 +27,22 @@ https://github.com/evil-mad/AxiDraw
 from axidrawinternal.plot_utils_import import from_dependency_import # plotink
 plot_utils = from_dependency_import('plotink.plot_utils')
 
+def digest_in_bounds(digest, bounds):
+    """
+    Return True if every vertex of a flattened digest lies within (or on) the
+    given bounds, [[x_min, y_min],[x_max, y_max]], and no subpath is empty.
+    Such a digest would pass through clip_at_bounds unchanged.
+    """
+    [[x_min, y_min], [x_max, y_max]] = bounds
+    for layer in digest.layers:
+        for path in layer.paths:
+            if not path.subpaths[0]:
+                return False
+            for [v_x, v_y] in path.subpaths[0]:
+                if not (x_min <= v_x <= x_max and y_min <= v_y <= y_max):
+                    return False
+    return True
+
 def clip_at_bounds(digest, phy_bounds, doc_bounds, warn_tol, doc_clip=True):
     """
     Step through subpaths in the digest, clipping them at plot
@@ -93,6 +109,11 @@ def clip_at_bounds(digest, phy_bounds, doc_bounds, warn_tol, doc_clip=True):
 
     digest.flatten()
 
+    if digest_in_bounds(digest, clip_bounds): # Common case: Nothing to clip.
+        for layer in digest.layers:
+            layer.flatten() # Re-flatten layer, as below
+        return out_of_bounds_flag
+
     for layer in digest.layers:    # Each layer is a LayerItem object.
         for path in layer.paths: # Each path is a PathItem object.
             input_subpath = path.subpaths[0]
@@ -138,8 +159,8 @@ def clip_at_bounds(digest, phy_bounds, doc_bounds, warn_tol, doc_clip=True):
                     if in_bounds and prev_in_bounds:
                         a_subpath.append(vertex)
                     else:
-                        segment =  [prev_vertex, vertex]
-                        accept, seg = plot_utils.clip_segment(segment, clip_bounds)
+                        accept, seg = plot_utils.clip_segment((prev_vertex, vertex),
+                                                              clip_bounds)
                         if accept:
                             if in_bounds and not prev_in_bounds:
                                 if len(a_subpath) > 0:
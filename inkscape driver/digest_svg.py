@@ -488,7 +488,7 @@ class DigestSVG:# pylint: disable=pointless-string-statement
         """
 
         # logger.debug('digest_path()\n')
-        # logger.debug('path d: ' + path_d)
+        # logger.debug('path d: %s', path_d)
 
         if path_d is None:
             return
@@ -61,7 +61,11 @@ def feed(ad_ref, move_list):
         drip_logger.setLevel(logging.DEBUG) # by default level is INFO
 
     # drip_logger.debug('\ndripfeed.feed()\n')
-    # drip_logger.debug('move_list:\n' + str(move_list)) # Can print full move list
+    # drip_logger.debug('move_list:\n%s', move_list) # Can print full move list
+
+    # Options are fixed for the duration of the feed; read these once, not per move.
+    preview = ad_ref.options.preview
+    sleep_during_moves = ad_ref.options.mode != "manual"
 
     for move in move_list:
         ad_ref.pause_check()
@@ -72,23 +76,26 @@ def feed(ad_ref, move_list):
         if ad_ref.pen.phys.xpos is None:
             return # Physical location is not well-defined; stop here.
 
-        if move[0] == 'lower':
-            ad_ref.pen.pen_lower(ad_ref)
+        move_type = move[0]
+        if move_type == 'SM': # Most common move type; check it first
+            feed_sm(ad_ref, move, drip_logger, preview, sleep_during_moves)
             continue
 
-        if move[0] == 'raise':
-            ad_ref.pen.pen_raise(ad_ref)
+        if move_type == 'lower':
+            ad_ref.pen.pen_lower(ad_ref)
             continue
 
-        if move[0] == 'SM':
-            feed_sm(ad_ref, move, drip_logger)
+        if move_type == 'raise':
+            ad_ref.pen.pen_raise(ad_ref)
             continue
 
 
-def feed_sm(ad_ref, move, drip_logger):
+def feed_sm(ad_ref, move, drip_logger, preview, sleep_during_moves):
     """
     Manage the process of sending a single "SM" move command to the AxiDraw,
         and simulate doing so when in preview mode.
+    The preview and sleep_during_moves flags are given by feed(), which reads
+        them from the options once per move list.
     Take care of housekeeping while doing so, including:
         Skipping physical moves while in preview mode
         Updating previews
@@ -108,26 +115,24 @@ def feed_sm(ad_ref, move, drip_logger):
     #   * final pen_up state, boolean
     #   * travel distance (inch)
 
-    move_steps2 = move[1][0]
-    move_steps1 = move[1][1]
-    move_time = move[1][2]
-    f_new_x = move[2][0]
-    f_new_y = move[2][1]
-    move_dist = move[2][3]
+    move_steps2, move_steps1, move_time = move[1]
+    seg_data = move[2]
+    f_new_x = seg_data[0]
+    f_new_y = seg_data[1]
+    move_dist = seg_data[3]
 
-    if ad_ref.options.preview:
+    if preview:
         ad_ref.plot_status.stats.pt_estimate += move_time
         # log_sm_for_preview(ad_ref, move)
 
         ad_ref.preview.log_sm_move(ad_ref, move)
 
-    else:
+    else: # The serial round trip dominates here; the ebb_motion lookup is negligible.
         ebb_motion.doXYMove(ad_ref.plot_status.port, move_steps2, move_steps1,\
             move_time, False)
 
-        if move_time > 50: # Sleep before issuing next command
-            if ad_ref.options.mode != "manual":
-                time.sleep(float(move_time - 30) / 1000.0)
+        if move_time > 50 and sleep_during_moves: # Sleep before issuing next command
+            time.sleep(float(move_time - 30) / 1000.0)
     # drip_logger.debug('XY move: (%s, %s), in %s ms', move_steps1, move_steps2, move_time)
     # drip_logger.debug('fNew(X,Y): (%.5f, %.5f)', f_new_x, f_new_y)
 
@@ -160,27 +165,34 @@ def page_layer_delay(ad_ref, between_pages=True, delay_ms=None):
         ad_ref.plot_status.progress.launch_sub(ad_ref,
             delay_ms, page=between_pages)
 
-    # Number of rest intervals:
-    sleep_interval = 100 # Time period to sleep, ms. Default: 100
-    time_remaining = delay_ms
-
-    while time_remaining > 0:
-        if ad_ref.plot_status.stopped:
-            break # Exit loop if stopped.
-        if time_remaining < 150: # If less than 150 ms left to delay,
-            sleep_interval = time_remaining     # do it all at once.
-
+    if ad_ref.options.preview: # Simulated delay; account for the whole delay at once
         if between_pages:
-            ad_ref.plot_status.stats.page_delays += sleep_interval
+            ad_ref.plot_status.stats.page_delays += delay_ms
         else:
-            ad_ref.plot_status.stats.layer_delays += sleep_interval
-
-        if ad_ref.options.preview:
-            ad_ref.plot_status.stats.pt_estimate += sleep_interval
-        else:
-            time.sleep(sleep_interval / 1000) # Use short intervals for responsiveness
-            ad_ref.plot_status.progress.update_sub_rel(sleep_interval) # update progress bar
+            ad_ref.plot_status.stats.layer_delays += delay_ms
+        ad_ref.plot_status.stats.pt_estimate += delay_ms
+    else:
+        # Sleep in short intervals for responsiveness, timed against a fixed deadline
+        # so that time spent checking for pause signals does not extend the delay.
+        time_start = time.monotonic()
+        deadline = time_start + delay_ms / 1000
+        elapsed_ms = 0 # Delay time completed and logged, ms
+
+        while not ad_ref.plot_status.stopped:
+            time_remaining = deadline - time.monotonic()
+            if time_remaining <= 0:
+                break
+            # Wait in 100 ms steps, or all at once if less than 150 ms remain.
+            # A keyboard pause ends the wait immediately; the pause button on
+            # the EBB can only be polled, so it is checked after each step.
+            ad_ref.wait_pause_request(time_remaining if time_remaining < 0.15 else 0.1)
+            interval = min(delay_ms, round((time.monotonic() - time_start) * 1000)) - elapsed_ms
+            elapsed_ms += interval
+            if between_pages:
+                ad_ref.plot_status.stats.page_delays += interval
+            else:
+                ad_ref.plot_status.stats.layer_delays += interval
+            ad_ref.plot_status.progress.update_sub_rel(interval) # update progress bar
             ad_ref.pause_check() # Detect button press while between plots
-        time_remaining -= sleep_interval
     ad_ref.plot_status.progress.close_sub()
     delay_between_copies = False
@@ -138,58 +138,64 @@ def plan_trajectory(ad_ref, vertex_list, xyz_pos=None):
         segment_input_data = (vertex_list[1][0], vertex_list[1][1], 0, 0, False)
         return compute_segment(ad_ref, segment_input_data, xyz_pos)
 
-    # traj_logger.debug('Input path to plan_trajectory: ')
-    # if traj_logger.isEnabledFor(logging.DEBUG):
+    # if traj_logger.isEnabledFor(logging.DEBUG): # Skip the whole dump unless debugging
+    #     traj_logger.debug('Input path to plan_trajectory: ')
     #     for x_y in vertex_list:
     #         traj_logger.debug('x: %.3f, y: %.3f', x_y[0], x_y[1])
-    #         traj_logger.debug('\ntraj_length: %s', traj_length)
+    #     traj_logger.debug('\ntraj_length: %s', traj_length)
+
+    params = ad_ref.params  # Local references, used throughout
+    options = ad_ref.options
 
     speed_limit = ad_ref.speed_pendown  # Maximum travel rate (in/s), in XY plane.
     if f_pen_up:
         speed_limit = ad_ref.speed_penup  # For pen-up manual moves
     # traj_logger.debug('\nspeed_limit (plan_trajectory): %.3f in/s', speed_limit)
 
-    traj_dists = array('f')  # float, Segment length (distance) when arriving at the junction
-    traj_vels = array('f')  # float, Velocity (_speed_, really) when arriving at the junction
+    # float, Segment length (distance) when arriving at the junction. Preallocated to
+    #   its upper bound, with first value 0 at time t = 0; trimmed after the loop below.
+    traj_dists = array('f', [0.0]) * traj_length
+    seg_count = 1  # Number of entries in traj_dists that are in use
 
-    traj_vectors = []  # Array that will hold normalized unit vectors along each segment
-    trimmed_path = []  # Array that will hold usable segments of vertex_list
+    # The unit vectors are only ever read in (x, y) pairs, so they are kept as tuples;
+    #   separate x and y arrays would need an extra append here and a wider zip below.
+    traj_vectors = []  # (x, y) tuples: normalized unit vectors along each segment
+    trimmed_path = []  # (x, y) tuples: usable segment end points from vertex_list
+    add_vector = traj_vectors.append # Bound methods, for the per-vertex loop below
+    add_point = trimmed_path.append
 
-    traj_dists.append(0.0)  # First value, at time t = 0
-    traj_vels.append(0.0)  # First value, at time t = 0
-
-    if ad_ref.options.resolution == 1:  # High-resolution mode
-        min_dist = ad_ref.params.max_step_dist_hr # Skip segments likely to be < one step
+    if options.resolution == 1:  # High-resolution mode
+        min_dist = params.max_step_dist_hr # Skip segments likely to be < one step
     else:
-        min_dist = ad_ref.params.max_step_dist_lr # Skip segments likely to be < one step
+        min_dist = params.max_step_dist_lr # Skip segments likely to be < one step
+    hypot = math.hypot
 
-    last_index = 0
-    for i in range(1, traj_length):
-        # Construct arrays of position and distances, skipping near-zero length segments.
+    vertices = iter(vertex_list) # Walk the list in place, without copying a slice of it
+    [last_x, last_y] = next(vertices)
+    for [v_x, v_y] in vertices:
+        # Construct arrays of position, distances, and unit vectors in a single pass,
+        #   skipping near-zero length segments.
 
-        tmp_dist_x = vertex_list[i][0] - vertex_list[last_index][0] # Distance per segment
-        tmp_dist_y = vertex_list[i][1] - vertex_list[last_index][1]
+        tmp_dist_x = v_x - last_x # Distance per segment
+        tmp_dist_y = v_y - last_y
 
-        tmp_dist = plot_utils.distance(tmp_dist_x, tmp_dist_y)
+        tmp_dist = hypot(tmp_dist_x, tmp_dist_y)
 
         if tmp_dist >= min_dist:
-            traj_dists.append(tmp_dist)
+            traj_dists[seg_count] = tmp_dist
+            seg_count += 1
             # Normalized unit vectors for computing cosine factor
-            traj_vectors.append([tmp_dist_x / tmp_dist, tmp_dist_y / tmp_dist])
-            tmp_x = vertex_list[i][0]
-            tmp_y = vertex_list[i][1]
-            trimmed_path.append([tmp_x, tmp_y])  # Selected, usable portions of vertex_list.
-            # traj_logger.debug('\nSegment: vertex_list[%s] -> [%s]', last_index, i)
-            # traj_logger.debug('Dest: x: %.3f,  y: %.3f. Dist.: %.3f', tmp_x, tmp_y, tmp_dist)
-            last_index = i
-        else:
-            # traj_logger.debug('\nSegment: vertex_list[%s] -> [%s]: near zero; skipping.',
-            #     last_index, i)
-            # traj_logger.debug(f'  x: {vertex_list[i][0]:1.3f}, ' +
-            #     f'y: {vertex_list[i][1]:1.3f}, distance: {tmp_dist:1.3f}')
-            pass
-
-    traj_length = len(traj_dists)
+            add_vector((tmp_dist_x / tmp_dist, tmp_dist_y / tmp_dist))
+            add_point((v_x, v_y))  # Selected, usable portions of vertex_list.
+            # traj_logger.debug('Dest: x: %.3f,  y: %.3f. Dist.: %.3f', v_x, v_y, tmp_dist)
+            last_x = v_x
+            last_y = v_y
+        # else:
+            # traj_logger.debug('\nSegment near zero; skipping.')
+            # traj_logger.debug('  x: %.3f, y: %.3f, distance: %.3f', v_x, v_y, tmp_dist)
+
+    del traj_dists[seg_count:]
+    traj_length = seg_count
 
     if traj_length < 2:
         # traj_logger.debug('\nSkipped a path element without well-defined segments.')
@@ -197,22 +203,19 @@ def plan_trajectory(ad_ref, vertex_list, xyz_pos=None):
 
     if traj_length < 3: # plot the element if it is just a line
         # traj_logger.debug('\nDrawing straight line, not a curve.')
-        segment_input_data = (trimmed_path[0][0], trimmed_path[0][1], 0, 0, False)
+        segment_input_data = (*trimmed_path[0], 0, 0, False)
         return compute_segment(ad_ref, segment_input_data, xyz_pos)
 
     # traj_logger.debug('\nAfter removing any zero-length segments, we are left with: ')
     # traj_logger.debug('traj_dists[0]: %.3f', traj_dists[0])
     # if traj_logger.isEnabledFor(logging.DEBUG):
     #     for i in range(0, len(trimmed_path)):
-    #         traj_logger.debug(f'i: {i}, x: {trimmed_path[i][0]:1.3f}, ' +
-    #             f'y: {trimmed_path[i][1]:1.3f}, distance: {traj_dists[i + 1]:1.3f}')
+    #         traj_logger.debug('i: %s, x: %.3f, y: %.3f, distance: %.3f', i,
+    #             trimmed_path[i][0], trimmed_path[i][1], traj_dists[i + 1])
     #         traj_logger.debug('  And... traj_dists[i+1]: %.3f', traj_dists[i + 1])
 
     # Acceleration/deceleration rates:
-    if f_pen_up:
-        accel_rate = ad_ref.params.accel_rate_pu * ad_ref.options.accel / 100.0
-    else:
-        accel_rate = ad_ref.params.accel_rate * ad_ref.options.accel / 100.0
+    accel_rate = ad_ref.accel_penup if f_pen_up else ad_ref.accel_pendown
 
     # Maximum acceleration time: Time needed to accelerate from full stop to maximum speed:
     # v = a * t, so t_max = vMax / a
@@ -294,64 +297,73 @@ def plan_trajectory(ad_ref, vertex_list, xyz_pos=None):
     still have a solution for getting to the endpoint at zero speed.
     """
 
-    delta = ad_ref.params.cornering / 5000  # Corner rounding/tolerance factor.
+    delta = params.cornering / 5000  # Corner rounding/tolerance factor.
+    sqrt = math.sqrt # Local reference for the per-vertex loops
+    two_accel = 2 * accel_rate
 
-    for i in range(1, traj_length - 1):
-        dcurrent = traj_dists[i]  # Length of the segment leading up to this vertex
+    """
+    Velocity at vertex: Part II
 
-        v_prev_exit = traj_vels[i - 1]  # Velocity when leaving previous vertex
+    Assuming that we have the same velocity when we enter and
+    leave a corner, our acceleration limit provides a velocity
+    that depends upon the angle between input and output directions.
 
-        """
-        Velocity at vertex: Part I
+    The cornering algorithm models the corner as a slightly smoothed corner,
+    to estimate the angular acceleration that we encounter:
+    https://onehossshay.wordpress.com/2011/09/24/improving_grbl_cornering_algorithm/
 
-        Check to see what our plausible maximum speeds are, from
-        acceleration only, without concern about cornering, nor deceleration.
-        """
+    The dot product of the unit vectors is equal to the cosine of the angle between the
+    two unit vectors, giving the deflection between the incoming and outgoing angles.
+    Note that this angle is (pi - theta), in the convention of that article, giving us
+    a sign inversion. [cos(pi - theta) = - cos(theta)]
 
-        if dcurrent > accel_dist:
-            # There _is_ enough distance in the segment for us to either
-            # accelerate to maximum speed or come to a full stop before this vertex.
-            vcurrent_max = speed_limit
-            # traj_logger.debug('Speed Limit on vel : %s', i)
-        else:
-            # There is _not necessarily_ enough distance in the segment for us to either
-            # accelerate to maximum speed or come to a full stop before this vertex.
-            # Calculate how much we *can* swing the velocity by:
+    This limit depends only upon the path geometry, so it is computed for every
+    interior vertex up front, ahead of the forward pass (Part I) that depends on it.
+    """
+    # Cornering speed limit at each interior vertex, i = 1 to traj_length - 2.
+    #   Dot product of unit vectors, clamped to [-1, 1] against rounding error:
+    junction_vels = []
+    for (x_in, y_in), (x_out, y_out) in zip(traj_vectors, traj_vectors[1:]):
+        cosine_factor = - max(-1, min(1, x_in * x_out + y_in * y_out))
 
-            vcurrent_max = plot_utils.vFinal_Vi_A_Dx(v_prev_exit, accel_rate, dcurrent)
-            vcurrent_max = min(vcurrent_max, speed_limit)
-            # traj_logger.debug('traj_vels I: %.3f', vcurrent_max)
+        root_factor = sqrt((1 - cosine_factor) / 2)
+        denominator = 1 - root_factor
+        if denominator > 0.0001:
+            rfactor = (delta * root_factor) / denominator
+        else:
+            rfactor = 100000
+        junction_vels.append(sqrt(accel_rate * rfactor))
 
-        """
-        Velocity at vertex: Part II 
+    # float, Velocity (_speed_, really) when arriving at the junction.
+    #   First and last values, at the path ends, remain zero.
+    traj_vels = array('f', [0.0]) * traj_length
 
-        Assuming that we have the same velocity when we enter and
-        leave a corner, our acceleration limit provides a velocity
-        that depends upon the angle between input and output directions.
+    for i, vjunction_max in enumerate(junction_vels, 1):
+        dcurrent = traj_dists[i]  # Length of the segment leading up to this vertex
 
-        The cornering algorithm models the corner as a slightly smoothed corner,
-        to estimate the angular acceleration that we encounter:
-        https://onehossshay.wordpress.com/2011/09/24/improving_grbl_cornering_algorithm/
+        """
+        Velocity at vertex: Part I
 
-        The dot product of the unit vectors is equal to the cosine of the angle between the
-        two unit vectors, giving the deflection between the incoming and outgoing angles. 
-        Note that this angle is (pi - theta), in the convention of that article, giving us
-        a sign inversion. [cos(pi - theta) = - cos(theta)]
+        Check to see what our plausible maximum speeds are, from
+        acceleration only, without concern about cornering, nor deceleration.
         """
-        cosine_factor = - plot_utils.dotProductXY(traj_vectors[i - 1], traj_vectors[i])
 
-        root_factor = math.sqrt((1 - cosine_factor) / 2)
-        denominator = 1 - root_factor
-        if denominator > 0.0001:
-            rfactor = (delta * root_factor) / denominator
-        else:
-            rfactor = 100000
-        vjunction_max = math.sqrt(accel_rate * rfactor)
+        # Speed limit at this vertex, including cornering (Part II).
+        vcurrent_max = min(speed_limit, vjunction_max)
 
-        vcurrent_max = min(vcurrent_max, vjunction_max)
+        if dcurrent <= accel_dist:
+            # There is _not necessarily_ enough distance in the segment for us to either
+            # accelerate to maximum speed or come to a full stop before this vertex.
+            # Calculate how much we *can* swing the velocity by, from the
+            # velocity when leaving the previous vertex: v^2 = v_prev^2 + 2 a d.
+            # Compare squared speeds; only take the root if this is the tighter limit.
+            v_prev_exit = traj_vels[i - 1]
+            v_reach_sq = v_prev_exit * v_prev_exit + two_accel * dcurrent
+            if v_reach_sq < vcurrent_max * vcurrent_max:
+                vcurrent_max = sqrt(v_reach_sq)
+            # traj_logger.debug('traj_vels I: %.3f', vcurrent_max)
 
-        traj_vels.append(vcurrent_max)  # "Forward-going" speed limit at this vertex.
-    traj_vels.append(0.0)  # Add zero velocity, for final vertex.
+        traj_vels[i] = vcurrent_max  # "Forward-going" speed limit at this vertex.
 
     # if traj_logger.isEnabledFor(logging.DEBUG):
     #     traj_logger.debug('\n')
@@ -368,44 +380,69 @@ def plan_trajectory(ad_ref, vertex_list, xyz_pos=None):
     can properly decelerate in the given distances.
     """
 
-    for j in range(1, traj_length):
-        i = traj_length - j  # Range: From (traj_length - 1) down to 1.
-
-        v_final = traj_vels[i]
+    v_final = traj_vels[-1]
+    for i in range(traj_length - 1, 0, -1): # From (traj_length - 1) down to 1.
         v_initial = traj_vels[i - 1]
         seg_length = traj_dists[i]
 
         if v_initial > v_final and seg_length > 0:
-            v_init_max = plot_utils.vInitial_VF_A_Dx(v_final, -accel_rate, seg_length)
+            # Highest initial speed from which we can decelerate to v_final within seg_length:
+            #   v_initial^2 = v_final^2 + 2 * accel_rate * seg_length
+            #   Compare squared speeds; only take the root if we must slow down.
+            v_init_max_sq = v_final * v_final + two_accel * seg_length
             # traj_logger.debug(
-            #     f'VInit Calc: (v_final = {v_final:1.3f}, accel_rate = {accel_rate:1.3f},' +
-            #     f' seg_length = {seg_length:1.3f}) ')
-            if v_init_max < v_initial:
-                v_initial = v_init_max
-            traj_vels[i - 1] = v_initial
+            #     'VInit Calc: (v_final = %.3f, accel_rate = %.3f, seg_length = %.3f) ',
+            #     v_final, accel_rate, seg_length)
+            if v_init_max_sq < v_initial * v_initial:
+                traj_vels[i - 1] = sqrt(v_init_max_sq)
+        v_final = traj_vels[i - 1]
 
     # if traj_logger.isEnabledFor(logging.DEBUG):
     #     for dist in traj_vels:
     #         traj_logger.debug('traj_vels III: %.3f', dist)
     #     traj_logger.debug(' ')
 
+    # Each segment is planned from the position where the previous one ended, so the
+    #   segments are computed in sequence; pair each end point with its entry & exit speeds.
     move_list = []
-    for i in range(0, traj_length - 1):
+    add_moves = move_list.extend
+    for (x_dest, y_dest), v_initial, v_final in zip(trimmed_path, traj_vels, traj_vels[1:]):
 
-        segment_input_data = (trimmed_path[i][0], trimmed_path[i][1],
-            traj_vels[i], traj_vels[i + 1], False)
+        segment_input_data = (x_dest, y_dest, v_initial, v_final, False)
 
         move_temp, data_list = compute_segment(ad_ref, segment_input_data, xyz_pos)
 
         if data_list is not None: # Update current position
-            xyz_pos.xpos = data_list[0]
-            xyz_pos.ypos = data_list[1]
-            xyz_pos.z_up = data_list[2]
+            xyz_pos.xpos, xyz_pos.ypos, xyz_pos.z_up = data_list
         if move_temp is not None:
-            move_list.extend(move_temp)
+            add_moves(move_temp)
     return move_list, data_list
 
 
+def velocity_ramp(duration_array, dist_array, intervals, time_per_interval,
+                  velocity_step_size, velocity, time_elapsed, position):
+    """
+    Append a linear velocity ramp, of the given number of constant-velocity time
+    intervals, to the duration and distance arrays of compute_segment().
+
+    The velocity changes by velocity_step_size (negative when decelerating) at the
+    start of each interval. Returns the final velocity, elapsed time, and position.
+
+    Times and positions are computed in closed form rather than summed interval by
+    interval: after k intervals, the distance covered is the sum of an arithmetic
+    series, time_per_interval * k * (velocity + (k + 1) * velocity_step_size / 2).
+    """
+    half_step = 0.5 * velocity_step_size
+    counts = range(1, intervals + 1)
+    duration_array.extend(round((time_elapsed + k * time_per_interval) * 1000.0)
+        for k in counts)
+    dist_array.extend(position + time_per_interval * k * (velocity + (k + 1) * half_step)
+        for k in counts)  # Estimated distance along direction of travel
+    return (velocity + intervals * velocity_step_size,
+            time_elapsed + intervals * time_per_interval,
+            position + time_per_interval * intervals * (velocity + (intervals + 1) * half_step))
+
+
 def compute_segment(ad_ref, data, xyz_pos=None):
     """
     Plan a straight line segment with given initial and final velocity.
@@ -480,34 +517,31 @@ def compute_segment(ad_ref, data, xyz_pos=None):
     # if spew_segment_debug_data:
     #     seg_logger.setLevel(logging.DEBUG) # by default level is INFO
 
-    # if ad_ref.plot_status.stopped:
-    #     spew_text = '\nSkipping '
-    # else:
-    #     spew_text = '\nExecuting '
-    # spew_text += 'compute_segment() function\n'
-    # if f_pen_up:
-    #     spew_text += '  Pen-up transit'
-    # else:
-    #     spew_text += '  Pen-down move'
-    # spew_text += f' from (x = {f_current_x:1.3f}, y = {f_current_y:1.3f})'
-    # spew_text += f' to (x = {x_dest:1.3f}, y = {y_dest:1.3f})\n'
-    # spew_text += f'    w/ v_i = {v_i:1.2f}, v_f = {v_f:1.2f} '
-    # seg_logger.debug(spew_text)
+    # seg_logger.debug('\n%s compute_segment() function\n  %s from (x = %.3f, y = %.3f)' +
+    #     ' to (x = %.3f, y = %.3f)\n    w/ v_i = %.2f, v_f = %.2f ',
+    #     'Skipping' if ad_ref.plot_status.stopped else 'Executing',
+    #     'Pen-up transit' if f_pen_up else 'Pen-down move',
+    #     f_current_x, f_current_y, x_dest, y_dest, v_i, v_f)
     # if ad_ref.plot_status.stopped:
     #     seg_logger.debug(' -> NOTE: Plot is in a Stopped state.')
 
+    params = ad_ref.params  # Local references, used throughout
+    options = ad_ref.options
+    step_scale = ad_ref.step_scale
+
     constant_vel_mode = False
-    if ad_ref.options.const_speed and not f_pen_up:
+    if options.const_speed and not f_pen_up:
         constant_vel_mode = True
 
     if not ignore_limits:  # check page size limits:
-        tolerance = ad_ref.params.bounds_tolerance # Truncate up to 1 step w/o error.
-        x_dest, x_bounded = plot_utils.checkLimitsTol(x_dest,
-            ad_ref.bounds[0][0], ad_ref.bounds[1][0], tolerance)
-        y_dest, y_bounded = plot_utils.checkLimitsTol(y_dest,
-            ad_ref.bounds[0][1], ad_ref.bounds[1][1], tolerance)
-        if x_bounded or y_bounded:
-            ad_ref.warnings.add_new('bounds')
+        [[x_min, y_min], [x_max, y_max]] = ad_ref.bounds
+        # Destinations within bounds, the usual case, need no clipping or warning.
+        if not (x_min <= x_dest <= x_max and y_min <= y_dest <= y_max):
+            tolerance = params.bounds_tolerance # Truncate up to 1 step w/o error.
+            x_dest, x_bounded = plot_utils.checkLimitsTol(x_dest, x_min, x_max, tolerance)
+            y_dest, y_bounded = plot_utils.checkLimitsTol(y_dest, y_min, y_max, tolerance)
+            if x_bounded or y_bounded:
+                ad_ref.warnings.add_new('bounds')
 
     delta_x_inches = x_dest - f_current_x
     delta_y_inches = y_dest - f_current_y
@@ -523,13 +557,14 @@ def compute_segment(ad_ref, data, xyz_pos=None):
 
     motor_dist1 = delta_x_inches + delta_y_inches # Inches that belt must turn at Motor 1
     motor_dist2 = delta_x_inches - delta_y_inches # Inches that belt must turn at Motor 2
-    motor_steps1 = int(round(ad_ref.step_scale * motor_dist1)) # Round to the nearest motor step
-    motor_steps2 = int(round(ad_ref.step_scale * motor_dist2)) # Round to the nearest motor step
+    motor_steps1 = round(step_scale * motor_dist1) # Round to the nearest motor step
+    motor_steps2 = round(step_scale * motor_dist2) # Round to the nearest motor step
+    floor = math.floor # Local reference for the interval counts below
 
     # Since we are rounding, we need to keep track of the actual distance moved,
     #   not just the _requested_ distance to move.
-    motor_dist1_rounded = float(motor_steps1) / (2.0 * ad_ref.step_scale)
-    motor_dist2_rounded = float(motor_steps2) / (2.0 * ad_ref.step_scale)
+    motor_dist1_rounded = float(motor_steps1) / (2.0 * step_scale)
+    motor_dist2_rounded = float(motor_steps2) / (2.0 * step_scale)
 
     # Convert back to find the actual X & Y distances that will be moved:
     delta_x_inches_rounded = (motor_dist1_rounded + motor_dist2_rounded)
@@ -540,24 +575,25 @@ def compute_segment(ad_ref, data, xyz_pos=None):
 
     segment_length_inches = plot_utils.distance(delta_x_inches_rounded, delta_y_inches_rounded)
 
-    # seg_logger.debug('\ndelta_x_inches Requested: %.4f', delta_x_inches)
-    # seg_logger.debug('delta_y_inches Requested: %.4f', delta_y_inches)
-    # seg_logger.debug('motor_steps1: %s', motor_steps1)
-    # seg_logger.debug('motor_steps2: %s', motor_steps2)
-    # seg_logger.debug('\ndelta_x_inches to be moved: %.4f', delta_x_inches_rounded)
-    # seg_logger.debug('delta_y_inches to be moved: %.4f', delta_y_inches_rounded)
-    # seg_logger.debug('segment_length_inches: %.4f', segment_length_inches)
-    # if not f_pen_up:
-    #     seg_logger.debug('\nBefore speedlimit check::')
-    #     seg_logger.debug('vi_inch_per_s:  %.4f', vi_inch_per_s)
-    #     seg_logger.debug('vf_inch_per_s:  %.4f', vf_inch_per_s)
+    # if seg_logger.isEnabledFor(logging.DEBUG): # One check for the whole group
+    #     seg_logger.debug('\ndelta_x_inches Requested: %.4f', delta_x_inches)
+    #     seg_logger.debug('delta_y_inches Requested: %.4f', delta_y_inches)
+    #     seg_logger.debug('motor_steps1: %s', motor_steps1)
+    #     seg_logger.debug('motor_steps2: %s', motor_steps2)
+    #     seg_logger.debug('\ndelta_x_inches to be moved: %.4f', delta_x_inches_rounded)
+    #     seg_logger.debug('delta_y_inches to be moved: %.4f', delta_y_inches_rounded)
+    #     seg_logger.debug('segment_length_inches: %.4f', segment_length_inches)
+    #     if not f_pen_up:
+    #         seg_logger.debug('\nBefore speedlimit check::')
+    #         seg_logger.debug('vi_inch_per_s:  %.4f', vi_inch_per_s)
+    #         seg_logger.debug('vf_inch_per_s:  %.4f', vf_inch_per_s)
 
     if f_pen_up:
         speed_limit = ad_ref.speed_penup # Maximum travel speeds
-        accel_rate = ad_ref.params.accel_rate_pu * ad_ref.options.accel / 100.0
+        accel_rate = ad_ref.accel_penup # Acceleration rates, set in enable_motors()
     else:
         speed_limit = ad_ref.speed_pendown # Maximum travel speeds
-        accel_rate = ad_ref.params.accel_rate * ad_ref.options.accel / 100.0
+        accel_rate = ad_ref.accel_pendown
 
     # Maximum acceleration time: Time needed to accelerate from full stop to maximum speed:
     #       v = a * t, so t_max = vMax / a
@@ -568,46 +604,52 @@ def compute_segment(ad_ref, data, xyz_pos=None):
     vi_inch_per_s = min(vi_inch_per_s, speed_limit)
     vf_inch_per_s = min(vf_inch_per_s, speed_limit)
 
-    # seg_logger.debug('\nspeed_limit (PlotSegment): %.4f', speed_limit)
-    # seg_logger.debug('After speedlimit check::')
-    # seg_logger.debug('vi_inch_per_s: %.4f', vi_inch_per_s)
-    # seg_logger.debug('vf_inch_per_s: %.4f', vf_inch_per_s)
+    # if seg_logger.isEnabledFor(logging.DEBUG):
+    #     seg_logger.debug('\nspeed_limit (PlotSegment): %.4f', speed_limit)
+    #     seg_logger.debug('After speedlimit check::')
+    #     seg_logger.debug('vi_inch_per_s: %.4f', vi_inch_per_s)
+    #     seg_logger.debug('vf_inch_per_s: %.4f', vf_inch_per_s)
 
     # Times to reach maximum speed, from our initial velocity:
     # vMax = vi + a*t  =>  t = (vMax - vi)/a
     # vf = vMax - a*t   =>  t = -(vf - vMax)/a = (vMax - vf)/a
     # -- These are _maximums_. We often do not have enough time/space to reach full speed.
 
-    t_accel_max = (speed_limit - vi_inch_per_s) / accel_rate
-    t_decel_max = (speed_limit - vf_inch_per_s) / accel_rate
+    inv_accel = 1.0 / accel_rate
+    t_accel_max = (speed_limit - vi_inch_per_s) * inv_accel
+    t_decel_max = (speed_limit - vf_inch_per_s) * inv_accel
 
-    # seg_logger.debug('\naccel_rate: %.3f', accel_rate)
-    # seg_logger.debug('speed_limit: %.3f', speed_limit)
-    # seg_logger.debug('vi_inch_per_s: %.3f', vi_inch_per_s)
-    # seg_logger.debug('vf_inch_per_s: %.3f', vf_inch_per_s)
-    # seg_logger.debug('t_accel_max: %.3f', t_accel_max)
-    # seg_logger.debug('t_decel_max: %.3f', t_decel_max)
+    # if seg_logger.isEnabledFor(logging.DEBUG):
+    #     seg_logger.debug('\naccel_rate: %.3f', accel_rate)
+    #     seg_logger.debug('speed_limit: %.3f', speed_limit)
+    #     seg_logger.debug('vi_inch_per_s: %.3f', vi_inch_per_s)
+    #     seg_logger.debug('vf_inch_per_s: %.3f', vf_inch_per_s)
+    #     seg_logger.debug('t_accel_max: %.3f', t_accel_max)
+    #     seg_logger.debug('t_decel_max: %.3f', t_decel_max)
 
     # Distance to reach full speed, starting at speed vi_inch_per_s: d = vi * t + (1/2) a t^2
-    accel_dist_max = (vi_inch_per_s * t_accel_max) + (0.5 * accel_rate * t_accel_max * t_accel_max)
+    #   evaluated as d = t * (vi + (1/2) a t)
+    half_accel = 0.5 * accel_rate
+    accel_dist_max = t_accel_max * (vi_inch_per_s + half_accel * t_accel_max)
     # Use the same model for deceleration distance; modeling it with backwards motion:
-    decel_dist_max = (vf_inch_per_s * t_decel_max) + (0.5 * accel_rate * t_decel_max * t_decel_max)
+    decel_dist_max = t_decel_max * (vf_inch_per_s + half_accel * t_decel_max)
 
     max_vel_time_estimate = (segment_length_inches / speed_limit)
 
-    # seg_logger.debug('accel_dist_max: %.3f', accel_dist_max)
-    # seg_logger.debug('decel_dist_max: %.3f', decel_dist_max)
-    # seg_logger.debug('max_vel_time_estimate: %.3f', max_vel_time_estimate)
+    # if seg_logger.isEnabledFor(logging.DEBUG):
+    #     seg_logger.debug('accel_dist_max: %.3f', accel_dist_max)
+    #     seg_logger.debug('decel_dist_max: %.3f', decel_dist_max)
+    #     seg_logger.debug('max_vel_time_estimate: %.3f', max_vel_time_estimate)
 
     # time slices: Slice travel into intervals that are (say) 25 ms long.
-    time_slice = ad_ref.params.time_slice
+    time_slice = params.time_slice
 
     # Declare arrays: Integers are _normally_ 4-byte integers, but could be 2-byte
     #    on some systems. That could cause errors in rare cases of very long moves.
+    #    These are typed (unboxed) buffers, and each motion phase below adds all of its
+    #    intervals with a single extend(); the phase lengths are not known in advance.
     duration_array = array('I') # unsigned integer; up to 65 seconds for a move if only 2 bytes.
     dist_array = array('f') # float
-    dest_array1 = array('i') # signed integer
-    dest_array2 = array('i') # signed integer
 
     time_elapsed = 0.0
     position = 0.0
@@ -652,7 +694,7 @@ def compute_segment(ad_ref, data, xyz_pos=None):
             # seg_logger.debug('Type 1: Trapezoid \n')
             speed_max = speed_limit  # We will reach _full cruising speed_!
 
-            intervals = int(math.floor(t_accel_max / time_slice)) # Acceleration interval count
+            intervals = floor(t_accel_max / time_slice) # Acceleration interval count
 
             # If intervals == 0, then we are already at (or nearly at) full speed.
             if intervals > 0:
@@ -663,12 +705,10 @@ def compute_segment(ad_ref, data, xyz_pos=None):
                 # 6th (last) time interval is at 6*max/7
                 # after this interval, we are at full speed.
 
-                for index in range(0, intervals):  # Calculate acceleration phase
-                    velocity += velocity_step_size
-                    time_elapsed += time_per_interval
-                    position += velocity * time_per_interval
-                    duration_array.append(int(round(time_elapsed * 1000.0)))
-                    dist_array.append(position)  # Estimated distance along direction of travel
+                # Calculate acceleration phase:
+                velocity, time_elapsed, position = velocity_ramp(
+                    duration_array, dist_array, intervals, time_per_interval,
+                    velocity_step_size, velocity, time_elapsed, position)
                 # seg_logger.debug('Accel intervals: %s', intervals)
 
             # Add a center "coasting" speed interval IF there is time for it.
@@ -678,35 +718,35 @@ def compute_segment(ad_ref, data, xyz_pos=None):
                 # There is enough time for (at least) one interval at full cruising speed.
                 velocity = speed_max
                 cruising_time = coasting_distance / velocity
-                ct = cruising_time
                 cruise_interval = 20 * time_slice
-                while ct > (cruise_interval):
-                    ct -= cruise_interval
-                    time_elapsed += cruise_interval
-                    duration_array.append(int(round(time_elapsed * 1000.0)))
-                    position += velocity * cruise_interval
-                    dist_array.append(position)  # Estimated distance along direction of travel
+                # Full-length cruise intervals, then one final interval of (0, cruise_interval]
+                n_full = math.ceil(cruising_time / cruise_interval) - 1
+                ct = cruising_time - n_full * cruise_interval
+                cruise_dist = velocity * cruise_interval
+                duration_array.extend(round((time_elapsed + i * cruise_interval) * 1000.0)
+                    for i in range(1, n_full + 1))
+                dist_array.extend(position + i * cruise_dist for i in range(1, n_full + 1))
+                time_elapsed += n_full * cruise_interval
+                position += n_full * cruise_dist
 
                 time_elapsed += ct
-                duration_array.append(int(round(time_elapsed * 1000.0)))
+                duration_array.append(round(time_elapsed * 1000.0))
                 position += velocity * ct
                 dist_array.append(position)  # Estimated distance along direction of travel
 
                 # seg_logger.debug('Coast Distance: %.3f', coasting_distance)
                 # seg_logger.debug('Coast velocity: %.3f', velocity)
 
-            intervals = int(math.floor(t_decel_max / time_slice)) # Deceleration interval count
+            intervals = floor(t_decel_max / time_slice) # Deceleration interval count
 
             if intervals > 0:
                 time_per_interval = t_decel_max / intervals
                 velocity_step_size = (speed_max - vf_inch_per_s) / (intervals + 1.0)
 
-                for index in range(0, intervals):  # Calculate deceleration phase
-                    velocity -= velocity_step_size
-                    time_elapsed += time_per_interval
-                    position += velocity * time_per_interval
-                    duration_array.append(int(round(time_elapsed * 1000.0)))
-                    dist_array.append(position)  # Estimated distance along direction of travel
+                # Calculate deceleration phase:
+                velocity, time_elapsed, position = velocity_ramp(
+                    duration_array, dist_array, intervals, time_per_interval,
+                    -velocity_step_size, velocity, time_elapsed, position)
                 # seg_logger.debug('Decel intervals: %s', intervals)
 
         else:
@@ -788,7 +828,7 @@ def compute_segment(ad_ref, data, xyz_pos=None):
             vmax = vi_inch_per_s + accel_rate_local * ta
             # seg_logger.debug('vmax: %.3f', vmax)
 
-            intervals = int(math.floor(ta / time_slice)) # Acceleration interval count
+            intervals = floor(ta / time_slice) # Acceleration interval count
 
             if intervals == 0:
                 ta = 0
@@ -797,7 +837,7 @@ def compute_segment(ad_ref, data, xyz_pos=None):
             else:
                 td = 0
 
-            d_intervals = int(math.floor(td / time_slice)) # Deceleration interval count
+            d_intervals = floor(td / time_slice) # Deceleration interval count
 
             if intervals + d_intervals > 4:
                 if intervals > 0:
@@ -809,12 +849,10 @@ def compute_segment(ad_ref, data, xyz_pos=None):
                     # 6th (last) time interval is at 6*max/7
                     # after this interval, we are at full speed.
 
-                    for index in range(0, intervals):  # Calculate acceleration phase
-                        velocity += velocity_step_size
-                        time_elapsed += time_per_interval
-                        position += velocity * time_per_interval
-                        duration_array.append(int(round(time_elapsed * 1000.0)))
-                        dist_array.append(position)  # Estimated distance along direction of travel
+                    # Calculate acceleration phase:
+                    velocity, time_elapsed, position = velocity_ramp(
+                        duration_array, dist_array, intervals, time_per_interval,
+                        velocity_step_size, velocity, time_elapsed, position)
                 else:
                     pass
                     # seg_logger.debug('Note: Skipping accel phase in triangle.')
@@ -828,12 +866,10 @@ def compute_segment(ad_ref, data, xyz_pos=None):
                     # 6th (last) time interval is at 6*max/7
                     # after this interval, we are at full speed.
 
-                    for index in range(0, d_intervals):  # Calculate acceleration phase
-                        velocity -= velocity_step_size
-                        time_elapsed += time_per_interval
-                        position += velocity * time_per_interval
-                        duration_array.append(int(round(time_elapsed * 1000.0)))
-                        dist_array.append(position)  # Estimated distance along direction of travel
+                    # Calculate deceleration phase:
+                    velocity, time_elapsed, position = velocity_ramp(
+                        duration_array, dist_array, d_intervals, time_per_interval,
+                        -velocity_step_size, velocity, time_elapsed, position)
                 else:
                     pass
                     # seg_logger.debug('Note: Skipping decel phase in triangle.')
@@ -859,33 +895,33 @@ def compute_segment(ad_ref, data, xyz_pos=None):
                 vi_inch_per_s = (vmax + vi_inch_per_s) / 2
                 velocity = vi_inch_per_s  # Boost initial speed for this segment
 
-                local_accel = (vf_inch_per_s * vf_inch_per_s - vi_inch_per_s * vi_inch_per_s) /\
-                    (2.0 * segment_length_inches)
+                # Factor the difference of squares, (vf + vi)(vf - vi), to avoid cancellation
+                v_sum = vf_inch_per_s + vi_inch_per_s
+                v_diff = vf_inch_per_s - vi_inch_per_s
+                local_accel = v_sum * v_diff / (2.0 * segment_length_inches)
 
-                if local_accel > accel_rate:
-                    local_accel = accel_rate
-                elif local_accel < -accel_rate:
-                    local_accel = -accel_rate
                 if local_accel == 0:
                     # Initial velocity = final velocity -> Skip to constant velocity routine.
                     constant_vel_mode = True
                 else:
-                    t_segment = (vf_inch_per_s - vi_inch_per_s) / local_accel
+                    if abs(local_accel) <= accel_rate:
+                        # Unclamped: t = (vf - vi) / a simplifies to t = 2 x / (vf + vi)
+                        t_segment = 2.0 * segment_length_inches / v_sum
+                    else: # Clamp to the maximum acceleration rate, in either direction
+                        t_segment = v_diff / max(-accel_rate, min(accel_rate, local_accel))
 
-                    intervals = int(math.floor(t_segment / time_slice)) # Number during decel.
+                    intervals = floor(t_segment / time_slice) # Number during decel.
                     if intervals > 1:
                         time_per_interval = t_segment / intervals
-                        velocity_step_size = (vf_inch_per_s - vi_inch_per_s) / (intervals + 1.0)
+                        velocity_step_size = v_diff / (intervals + 1.0)
                         # For six time intervals of acceleration, first is at velocity (max/7)
                         # 6th (last) time interval is at 6*max/7
                         # after this interval, we are at full speed.
 
-                        for index in range(0, intervals):  # Calculate acceleration phase
-                            velocity += velocity_step_size
-                            time_elapsed += time_per_interval
-                            position += velocity * time_per_interval
-                            duration_array.append(int(round(time_elapsed * 1000.0)))
-                            dist_array.append(position)  # Distance along direction of travel
+                        # Calculate acceleration phase:
+                        velocity, time_elapsed, position = velocity_ramp(
+                            duration_array, dist_array, intervals, time_per_interval,
+                            velocity_step_size, velocity, time_elapsed, position)
                     else: # Short segment; No time for segments at different velocities.
                         vi_inch_per_s = vmax  # These are _slow_ segments;
                         constant_vel_mode = True  #   use fastest possible interpretation.
@@ -896,22 +932,18 @@ def compute_segment(ad_ref, data, xyz_pos=None):
 
         # seg_logger.debug('-> [Constant Velocity Mode Segment]\n')
 
-        if ad_ref.options.const_speed and not f_pen_up:
+        if options.const_speed and not f_pen_up:
             velocity = ad_ref.speed_pendown  # Constant pen-down speed
-        elif vf_inch_per_s > vi_inch_per_s:
-            velocity = vf_inch_per_s
-        elif vi_inch_per_s > vf_inch_per_s:
-            velocity = vi_inch_per_s
-        elif vi_inch_per_s > 0:  # Allow case of two are equal, but nonzero
-            velocity = vi_inch_per_s
-        else:  # Both endpoints are equal to zero.
-            velocity = ad_ref.speed_pendown / 10
-            # TODO: Check this method. May be better to level it out to same value as others.
+        else:  # Use the faster endpoint speed; this allows the two to be equal, but nonzero
+            velocity = max(vi_inch_per_s, vf_inch_per_s)
+            if velocity <= 0 and vi_inch_per_s == vf_inch_per_s: # Both endpoints equal zero.
+                velocity = ad_ref.speed_pendown / 10
+                # TODO: Check this method. May be better to level it out to same value as others.
 
         # seg_logger.debug('velocity: %s', velocity)
 
         time_elapsed = segment_length_inches / velocity
-        duration_array.append(int(round(time_elapsed * 1000.0)))
+        duration_array.append(round(time_elapsed * 1000.0))
         dist_array.append(segment_length_inches)  # Estimated distance along direction of travel
         position += segment_length_inches
 
@@ -920,39 +952,50 @@ def compute_segment(ad_ref, data, xyz_pos=None):
 
     # seg_logger.debug('position/segment_length_inches: %.6f', position / segment_length_inches)
 
-    for index in range(0, len(dist_array)):
-        # Scale our trajectory to the "actual" travel distance that we need:
-        fractional_distance = dist_array[index] / position # Position along intended path
-        dest_array1.append(int(round(fractional_distance * motor_steps1)))
-        dest_array2.append(int(round(fractional_distance * motor_steps2)))
-        sum(dest_array1)
+    # Scale our trajectory to the "actual" travel distance that we need:
+    fractions = [interval_dist / position for interval_dist in dist_array] # Along intended path
+
+    # Motor step destinations, one per interval; round() of a float returns an int.
+    dest_array1 = array('i', [round(fraction * motor_steps1) for fraction in fractions]) # signed
+    dest_array2 = array('i', [round(fraction * motor_steps2) for fraction in fractions]) # signed
+
+    # if seg_logger.isEnabledFor(logging.DEBUG):
+    #     seg_logger.debug('\nSanity check after computing motion:')
+    #     seg_logger.debug('Final motor_steps1: %s', dest_array1[-1]) # Last element in list
+    #     seg_logger.debug('Final motor_steps2: %s', dest_array2[-1]) # Last element in list
 
-    # seg_logger.debug('\nSanity check after computing motion:')
-    # seg_logger.debug('Final motor_steps1: %s', dest_array1[-1]) # Last element in list
-    # seg_logger.debug('Final motor_steps2: %s', dest_array2[-1]) # Last element in list
+    # Duration of each interval, from the cumulative times. Unlike the motor steps below,
+    #   these do not depend on the preceding moves. Zero-time moves are not allowed.
+    move_times = [max(duration - prev_time, 1) for duration, prev_time in
+        zip(duration_array, array('I', [0]) + duration_array)]
 
     prev_motor1 = 0
     prev_motor2 = 0
-    prev_time = 0
     move_list = []
-
-    for index in range(0, len(dest_array1)):
-        move_steps1 = dest_array1[index] - prev_motor1
-        move_steps2 = dest_array2[index] - prev_motor2
-        move_time = duration_array[index] - prev_time
-        prev_time = duration_array[index]
-
-        move_time = max(move_time, 1) # don't allow zero-time moves.
-
-        if abs(float(move_steps1) / float(move_time)) < 0.002:
+    add_move = move_list.append # Local references for the per-interval loop below
+    distance = plot_utils.distance
+    max_step_rate = params.max_step_rate # Steps per ms, on either motor
+    steps_per_inch = step_scale * 2.0 # Motor steps per inch of belt travel
+
+    # Note: prev_motor1/2 track steps actually issued, not the previous targets;
+    # steps dropped as too-slow below are carried into the following move.
+    for dest1, dest2, move_time in zip(dest_array1, dest_array2, move_times):
+        move_steps1 = dest1 - prev_motor1
+        move_steps2 = dest2 - prev_motor2
+
+        # Integer true division is exact to the nearest float; no float() casts needed.
+        if abs(move_steps1) / move_time < 0.002:
             move_steps1 = 0  # don't allow too-slow movements of this axis
-        if abs(float(move_steps2) / float(move_time)) < 0.002:
+        if abs(move_steps2) / move_time < 0.002:
             move_steps2 = 0  # don't allow too-slow movements of this axis
 
-        # Catch rounding errors that could cause an overspeed event:
-        while (abs(float(move_steps1) / float(move_time)) >= ad_ref.params.max_step_rate) or\
-            (abs(float(move_steps2) / float(move_time)) >= ad_ref.params.max_step_rate):
-            move_time += 1
+        # Catch rounding errors that could cause an overspeed event. Extend the move to the
+        #   shortest whole-ms duration that keeps the faster axis below the maximum rate:
+        fastest_steps = max(abs(move_steps1), abs(move_steps2))
+        if fastest_steps / move_time >= max_step_rate:
+            move_time = max(move_time + 1, int(fastest_steps / max_step_rate) + 1)
+            while fastest_steps / move_time >= max_step_rate: # Guard for float rounding
+                move_time += 1
             # seg_logger.debug('Note: Added delay to avoid overspeed event')
 
         prev_motor1 += move_steps1
@@ -960,18 +1003,18 @@ def compute_segment(ad_ref, data, xyz_pos=None):
 
         # If at least one motor step is required for this move, do so:
         if move_steps1 != 0 or move_steps2 != 0:
-            motor_dist1_temp = float(move_steps1) / (ad_ref.step_scale * 2.0)
-            motor_dist2_temp = float(move_steps2) / (ad_ref.step_scale * 2.0)
+            motor_dist1_temp = move_steps1 / steps_per_inch
+            motor_dist2_temp = move_steps2 / steps_per_inch
 
             x_delta = (motor_dist1_temp + motor_dist2_temp) # X Distance moved, inches
             y_delta = (motor_dist1_temp - motor_dist2_temp) # Y Distance moved, inches
-            move_dist_inches = plot_utils.distance(x_delta, y_delta) # Total move, inches
+            move_dist_inches = distance(x_delta, y_delta) # Total move, inches
 
             f_new_x = f_current_x + x_delta
             f_new_y = f_current_y + y_delta
 
             seg_data = [f_new_x, f_new_y, f_pen_up, move_dist_inches]
-            move_list.append(['SM', (move_steps2, move_steps1, move_time), seg_data])
+            add_move(['SM', (move_steps2, move_steps1, move_time), seg_data])
 
             f_current_x = f_new_x  # Update current position
             f_current_y = f_new_y
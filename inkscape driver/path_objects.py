@@ -36,6 +36,7 @@ to a very limited subset of SVG.
 Also included is a LayerProperties class, which manages parsing of layer names.
 """
 
+import re
 from math import sqrt
 from enum import Enum
 from lxml import etree
@@ -59,6 +60,9 @@ PLOB_BASE = """<?xml version="1.0" standalone="no"?>
 
 PLOB_VERSION = "1"
 
+LEADING_INT = re.compile(r'\d+')                   # Integer at start of a layer name
+LAYER_PARAM = re.compile(r'\+([hsd])(\d*)', re.I)  # +h, +s, or +d parameter and value
+
 class FillRule(Enum):
     """
     Based on SVG fill rules: https://www.w3.org/TR/SVG2/painting.html#WindingRule
@@ -94,6 +98,9 @@ class PathItem:
     equivalent to "nonzero", the default behavior.
     """
 
+    # One instance per path in the document; slots keep large digests compact.
+    __slots__ = ('subpaths', 'stroke', 'fill', 'fill_rule', 'item_id')
+
     def __init__(self):
         self.subpaths = None    # list of lists of 2-element vertices
         self.stroke = None      # stroke color or None
@@ -260,17 +267,9 @@ def find_int(name_string):
     Else, return None, and the original string.
     '''
 
-    temp_num_string = 'x'
-    string_pos = 1
-    while string_pos <= len(name_string):
-        layer_name_fragment = name_string[:string_pos]
-        if layer_name_fragment.isdigit():
-            temp_num_string = name_string[:string_pos]
-            string_pos += 1
-        else:
-            break
-    if str.isdigit(temp_num_string):
-        return int(float(temp_num_string)), name_string[len(temp_num_string):]
+    match = LEADING_INT.match(name_string)
+    if match:
+        return int(match.group()), name_string[match.end():]
     return None, name_string
 
 
@@ -309,24 +308,24 @@ class LayerProperties: # pylint: disable=too-many-instance-attributes
 
         self.number, remainder = find_int(layer_name)
 
-        while len(remainder) >= 3:
-            key = remainder[:2].lower()
-            if key in ['+h', '+s', '+d']:
-                remainder = remainder[2:]
-                number_temp, remainder = find_int(remainder)
-                if number_temp is not None:
-                    if key == "+d":
-                        if number_temp > 0: # Delay time, ms
-                            self.delay = number_temp
-                    if key == "+h":
-                        if 0 <= number_temp <= 100:
-                            self.height = number_temp
-                    if key == "+s":
-                        if 1 <= number_temp <= 110:
-                            self.speed = number_temp
-            else:
-                self.text = remainder
+        pos = 0 # Parse position within remainder
+        while len(remainder) - pos >= 3:
+            param = LAYER_PARAM.match(remainder, pos)
+            if param is None:
+                self.text = remainder[pos:]
                 break
+            pos = param.end()
+            if param.group(2):
+                key = param.group(1).lower()
+                number_temp = int(param.group(2))
+                if key == "d":
+                    if number_temp > 0: # Delay time, ms
+                        self.delay = number_temp
+                elif key == "h":
+                    if 0 <= number_temp <= 100:
+                        self.height = number_temp
+                elif 1 <= number_temp <= 110: # key == "s"
+                    self.speed = number_temp
 
     def compose(self):
         '''
@@ -521,7 +520,7 @@ class DocDigest:
     def to_plob(self):
         """
         Convert the contents of the DocDigest object into an lxml etree "Plob"
-        and return it.
+        and return it. Each call builds a new tree, owned by the caller.
 
         The Plob (Plot Object) format is a valid but highly-restricted subset
         of SVG. Only layers are allowed in the SVG root. Only polylines are
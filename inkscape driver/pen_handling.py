@@ -140,24 +140,26 @@ class PenLiftTiming: # pylint: disable=too-few-public-methods
             servo_move_min = ad_ref.params.servo_move_min
             servo_sweep_time = ad_ref.params.servo_sweep_time
 
-        # Raising time:
-        v_time = int(((servo_move_slope * v_dist + servo_move_min) ** 4 +
-            (servo_sweep_time * v_dist / ad_ref.options.pen_rate_raise) ** 4) ** 0.25)
-        if v_dist < 0.9:  # If up and down positions are equal, no initial delay
-            v_time = 0
+        # Transit term (A) is the same for raising and lowering:
+        transit_term = (servo_move_slope * v_dist + servo_move_min) ** 4
+        sweep_dist = servo_sweep_time * v_dist
 
-        v_time += ad_ref.options.pen_delay_up
-        v_time = max(0, v_time)  # Do not allow negative total delay time
-        self.raise_time = v_time
+        self.raise_time = self.servo_time(v_dist, transit_term,
+            sweep_dist / ad_ref.options.pen_rate_raise, ad_ref.options.pen_delay_up)
+        self.lower_time = self.servo_time(v_dist, transit_term,
+            sweep_dist / ad_ref.options.pen_rate_lower, ad_ref.options.pen_delay_down)
 
-        # Lowering time:
-        v_time = int(((servo_move_slope * v_dist + servo_move_min) ** 4 +
-            (servo_sweep_time * v_dist / ad_ref.options.pen_rate_lower) ** 4) ** 0.25)
+    @staticmethod
+    def servo_time(v_dist, transit_term, sweep_time, delay):
+        '''
+        Time for one pen transition: The 4th power average of the transit time (A), given
+        here already raised to the 4th power, and sweep time (B), plus the added delay.
+        '''
         if v_dist < 0.9:  # If up and down positions are equal, no initial delay
             v_time = 0
-        v_time += ad_ref.options.pen_delay_down
-        v_time = max(0, v_time)  # Do not allow negative total delay time
-        self.lower_time = v_time
+        else:
+            v_time = int((transit_term + sweep_time ** 4) ** 0.25)
+        return max(0, v_time + delay)  # Do not allow negative total delay time
 
 
 class PenStatus:
@@ -217,40 +219,24 @@ class PenHandler:
             return
 
         self.status.lifts += 1
-
-        v_time = self.heights.times.raise_time
-        if self.heights.narrow_band:
-            servo_pin = ad_ref.params.nb_servo_pin
-        else:
-            servo_pin = ad_ref.params.servo_pin
-
-        if ad_ref.options.preview:
-            ad_ref.preview.v_chart.rest(ad_ref, v_time)
-        else:
-            ebb_motion.sendPenUp(ad_ref.plot_status.port, v_time, servo_pin, False)
-            if (v_time > 50) and (ad_ref.options.mode not in\
-                ["manual", "align", "cycle"]):
-                time.sleep(float(v_time - 30) / 1000.0) # pause before issuing next command
-            if ad_ref.params.use_b3_out: # I/O Pin B3 output: low
-                ebb_motion.PBOutValue( ad_ref.plot_status.port, 3, 0, False)
-        self.phys.z_up = True
-
+        self.servo_move(ad_ref, self.heights.times.raise_time, True)
 
     def pen_lower(self, ad_ref):
         ''' Lower the pen '''
 
         self.status.preview_pen_state = -1  # For preview rendering use
 
-        if self.phys.z_up is not None:
-            if not self.phys.z_up:
-                return # skip if pen is state is _known_ and is down
-
-        # Skip if stopped:
-        if ad_ref.plot_status.stopped:
+        # Skip if pen state is _known_ and is down, or if stopped:
+        if (self.phys.z_up is not None and not self.phys.z_up) or ad_ref.plot_status.stopped:
             return
 
-        v_time = self.heights.times.lower_time
+        self.servo_move(ad_ref, self.heights.times.lower_time, False)
 
+    def servo_move(self, ad_ref, v_time, pen_up):
+        '''
+        Move the pen servo to the up or down position, allowing v_time (ms) for the move,
+        or simulate doing so in preview mode. Used by pen_raise() and pen_lower().
+        '''
         if self.heights.narrow_band:
             servo_pin = ad_ref.params.nb_servo_pin
         else:
@@ -259,13 +245,16 @@ class PenHandler:
         if ad_ref.options.preview:
             ad_ref.preview.v_chart.rest(ad_ref, v_time)
         else:
-            ebb_motion.sendPenDown(ad_ref.plot_status.port, v_time, servo_pin, False)
+            if pen_up:
+                ebb_motion.sendPenUp(ad_ref.plot_status.port, v_time, servo_pin, False)
+            else:
+                ebb_motion.sendPenDown(ad_ref.plot_status.port, v_time, servo_pin, False)
             if (v_time > 50) and (ad_ref.options.mode not in\
                 ["manual", "align", "cycle"]):
                 time.sleep(float(v_time - 30) / 1000.0) # pause before issuing next command
-            if ad_ref.params.use_b3_out: # I/O Pin B3 output: high
-                ebb_motion.PBOutValue( ad_ref.plot_status.port, 3, 1, False)
-        self.phys.z_up = False
+            if ad_ref.params.use_b3_out: # I/O Pin B3 output: low when up, high when down
+                ebb_motion.PBOutValue( ad_ref.plot_status.port, 3, 0 if pen_up else 1, False)
+        self.phys.z_up = pen_up
 
     def cycle(self, ad_ref):
         '''
@@ -35,6 +35,9 @@ text_utils = from_dependency_import('plotink.text_utils')
 inkex = from_dependency_import('ink_extensions.inkex')
 ebb_motion = from_dependency_import('plotink.ebb_motion')
 
+# Compiled XPath to find plotdata elements, with or without the SVG namespace
+PLOTDATA_XPATH = etree.XPath("//*[self::svg:plotdata|self::plotdata]", namespaces=inkex.NSS)
+
 
 class SVGPlotData:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
     """
@@ -106,7 +109,7 @@ class ResumeStatus:
         """
         self.read = False
         data_node = None
-        nodes = svg_tree.xpath("//*[self::svg:plotdata|self::plotdata]", namespaces=inkex.NSS)
+        nodes = PLOTDATA_XPATH(svg_tree)
         if nodes:
             data_node = nodes[0]
         if data_node is not None:
@@ -134,24 +137,24 @@ class ResumeStatus:
         pause_dist, pause_ref stored as integer with µm units
         """
         if not self.written:
-            for node in svg_tree.xpath("//*[self::svg:plotdata|self::plotdata]",\
-                namespaces=inkex.NSS):
+            for node in PLOTDATA_XPATH(svg_tree):
                 node_parent = node.getparent()
                 node_parent.remove(node)
             data_node = etree.SubElement(svg_tree, 'plotdata')
 
             if self.new.application == "":
                 self.new.application = "axidraw"  # Name of this program
-            data_node.set('application', self.new.application)
-            data_node.set('model', str(self.new.model))
-            data_node.set('plob_version', str(self.new.plob_version ))
-            data_node.set('layer', str(self.new.layer))
-            data_node.set('pause_dist', f"{round(self.new.pause_dist * 25400)}") # units µm
-            data_node.set('pause_ref',  f"{round(self.new.pause_ref * 25400)}") # units µm
-            data_node.set('last_x', f"{self.new.last_x * 25.4}") # float; units mm
-            data_node.set('last_y', f"{self.new.last_y * 25.4}") # float; units mm
-            data_node.set('rand_seed', f"{self.new.rand_seed}")
-            data_node.set('row', f"{self.new.row}")
+            data_node.attrib.update({
+                'application': self.new.application,
+                'model': str(self.new.model),
+                'plob_version': str(self.new.plob_version),
+                'layer': str(self.new.layer),
+                'pause_dist': f"{round(self.new.pause_dist * 25400)}", # units µm
+                'pause_ref': f"{round(self.new.pause_ref * 25400)}", # units µm
+                'last_x': f"{self.new.last_x * 25.4}", # float; units mm
+                'last_y': f"{self.new.last_y * 25.4}", # float; units mm
+                'rand_seed': f"{self.new.rand_seed}",
+                'row': f"{self.new.row}"})
             self.written = True
 
     def copy_old(self):
@@ -25,6 +25,23 @@ https://github.com/evil-mad/AxiDraw
 
 """
 
+# Fixed text of warning messages; adjacent literals are joined at compile time.
+VOLTAGE_WARNING = ("Note (voltage): Low voltage detected.\n"
+                   "Check that power supply is plugged in.\n")
+BOUNDS_WARNING = ("Warning (bounds): AxiDraw movement was limited by its"
+                  "\nphysical range of motion. If everything else looks"
+                  "\ncorrect, there may be an issue with the document size,"
+                  "\nor the wrong model of AxiDraw may be selected."
+                  "\nPlease contact technical support if you need assistance.\n")
+IMAGE_WARNING_TAIL = ("\nPlease convert images to vectors before plotting."
+                      "\nConsider using the Inkscape Path > Trace Bitmap tool.\n")
+TEXT_WARNING_TAIL = ("\nPlease convert text into vector paths before plotting."
+                     "\nConsider using the Inkscape Path > Object to Path tool."
+                     "\nAlternately, consider using Hershey Text to render your"
+                     "\ntext with stroke-based fonts.\n")
+OBJECT_WARNING_TAIL = ("\nPlease convert it to a path prior to plotting, and/or "
+                       "contact technical support if you need assistance.\n")
+
 def layer_name_text(layer_name):
     '''Format layer name text for displaying in warning messages'''
     if layer_name == '__digest-root__':
@@ -72,43 +89,26 @@ class PlotWarnings:
 
         if 'voltage' in self.warning_dict:
             if 'voltage' not in self.suppress_list:
-                warning_text_list.append(
-                    "Note (voltage): Low voltage detected.\n" +
-                    "Check that power supply is plugged in.\n"
-                )
+                warning_text_list.append(VOLTAGE_WARNING)
             self.warning_dict.pop('voltage')
 
         if 'bounds' in self.warning_dict:
             if 'bounds' not in self.suppress_list:
-                warning_text_list.append(
-                    "Warning (bounds): AxiDraw movement was limited by its" +
-                    "\nphysical range of motion. If everything else looks" +
-                    "\ncorrect, there may be an issue with the document size," +
-                    "\nor the wrong model of AxiDraw may be selected." +
-                    "\nPlease contact technical support if you need assistance.\n"
-                )
+                warning_text_list.append(BOUNDS_WARNING)
             self.warning_dict.pop('bounds')
 
         if 'image' in self.warning_dict:
             if 'image' not in self.suppress_list:
                 warning_text_list.append(
                     'Note (image): This file contains a bitmap image' +
-                    layer_name_text(self.warning_dict['image']) +
-                    "\nPlease convert images to vectors before plotting." +
-                    "\nConsider using the Inkscape Path > Trace Bitmap tool.\n"
-                    )
+                    layer_name_text(self.warning_dict['image']) + IMAGE_WARNING_TAIL)
             self.warning_dict.pop('image')
 
         if 'text' in self.warning_dict:
             if 'text' not in self.suppress_list:
                 warning_text_list.append(
                     'Note (plain-text): This file contains some plain text\n' +
-                    layer_name_text(self.warning_dict['text']) +
-                    "\nPlease convert text into vector paths before plotting." +
-                    "\nConsider using the Inkscape Path > Object to Path tool." +
-                    "\nAlternately, consider using Hershey Text to render your" +
-                    "\ntext with stroke-based fonts.\n"
-                )
+                    layer_name_text(self.warning_dict['text']) + TEXT_WARNING_TAIL)
             self.warning_dict.pop('text')
 
         for object_type, layer_location in self.warning_dict.items():
@@ -117,10 +117,7 @@ class PlotWarnings:
                 continue
             warning_text_list.append(
                 'Note (object): Unable to plot ' + object_type + ' object' +
-                layer_name_text(layer_location) +
-                "\nPlease convert it to a path prior to plotting, and/or " +
-                "contact technical support if you need assistance.\n"
-            )
+                layer_name_text(layer_location) + OBJECT_WARNING_TAIL)
 
         return warning_text_list
 
@@ -32,10 +32,21 @@ from lxml import etree
 
 from axidrawinternal.plot_utils_import import from_dependency_import
 simpletransform = from_dependency_import('ink_extensions.simpletransform')
-simplestyle = from_dependency_import('ink_extensions.simplestyle')
 inkex = from_dependency_import('ink_extensions.inkex')
 plot_utils = from_dependency_import('plotink.plot_utils')
 
+# Namespaced tag and attribute names used when building the preview layer
+G_TAG = inkex.addNS('g', 'svg')
+PATH_TAG = inkex.addNS('path', 'svg ')
+DESC_ATTR = inkex.addNS('desc', 'plot')
+GROUPMODE_ATTR = inkex.addNS('groupmode', 'inkscape')
+LABEL_ATTR = inkex.addNS('label', 'inkscape')
+
+# Top-level preview layers left behind by an earlier preview
+PREVIEW_LAYER_XPATH = etree.XPath(
+    "./*[(self::svg:g or self::g) and @inkscape:groupmode='layer'" +
+    " and @inkscape:label='% Preview']", namespaces=inkex.NSS)
+
 # ebb_serial = from_dependency_import('plotink.ebb_serial')  # https://github.com/evil-mad/plotink
 # ebb_motion = from_dependency_import('plotink.ebb_motion')
 
@@ -48,6 +59,7 @@ class VelocityChart:
     def __init__(self):
         self.enable = False # Velocity charts are disabled by default. (Set True to enable.
         self.vel_data_time = 0
+        # Velocity charts, lists of (time, y) points; formatted only when rendered:
         self.vel_chart1 = [] # Velocity chart, for preview of velocity vs time Motor 1
         self.vel_chart2 = []  # Velocity chart, for preview of velocity vs time Motor 2
         self.vel_data_chart_t = [] # Velocity chart, for preview of velocity vs time Total V
@@ -69,20 +81,31 @@ class VelocityChart:
         ad_ref.plot_status.stats.pt_estimate += v_time
         if not self.enable:
             return
-        self.update(ad_ref, 0, 0, 0)
-        self.vel_data_time += v_time
-        self.update(ad_ref, 0, 0, 0)
-
-    def update(self, ad_ref, v_1, v_2, v_tot):
-        """ Update velocity charts, using some appropriate scaling for X and Y display."""
+        self.hold(ad_ref, 0, 0, 0, v_time)
 
+    def hold(self, ad_ref, v_1, v_2, v_tot, duration):
+        """
+        Update velocity charts, using some appropriate scaling for X and Y display.
+        Velocities are held constant for the given duration (ms), adding points at both
+        the start and end of that time, for a stepped chart.
+        """
         if not (ad_ref.options.preview and self.enable):
             return
-        temp_time = self.vel_data_time / 1000.0
-        scale_factor = 10.0 / ad_ref.options.resolution
-        self.vel_chart1.append(f' {temp_time:0.3f} {8.5 - v_1 / scale_factor:0.3f}')
-        self.vel_chart2.append(f' {temp_time:0.3f} {8.5 - v_2 / scale_factor:0.3f}')
-        self.vel_data_chart_t.append(f' {temp_time:0.3f} {8.5 - v_tot / scale_factor:0.3f}')
+        inv_scale = ad_ref.options.resolution / 10.0
+        y_1 = 8.5 - v_1 * inv_scale
+        y_2 = 8.5 - v_2 * inv_scale
+        y_tot = 8.5 - v_tot * inv_scale
+        start_time = self.vel_data_time / 1000.0
+        self.vel_data_time += duration
+        end_time = self.vel_data_time / 1000.0
+        self.vel_chart1 += ((start_time, y_1), (end_time, y_1))
+        self.vel_chart2 += ((start_time, y_2), (end_time, y_2))
+        self.vel_data_chart_t += ((start_time, y_tot), (end_time, y_tot))
+
+    @staticmethod
+    def path_data(chart):
+        """ Format a velocity chart, a list of (time, y) tuples, as SVG path data """
+        return "M " + " ".join(f'{the_time:0.3f} {the_y:0.3f}' for the_time, the_y in chart)
 
 
 class Preview:
@@ -91,6 +114,8 @@ class Preview:
     """
 
     def __init__(self):
+        # Path data are kept as lists of short strings, joined once when rendered. List
+        #   appends are amortized O(1), and a single join() is linear in the total length.
         self.path_data_pu = []  # pen-up path data for preview layers
         self.path_data_pd = []  # pen-down path data for preview layers
         self.v_chart = VelocityChart()
@@ -117,47 +142,44 @@ class Preview:
         #   * final pen_up state, boolean
         #   * travel distance (inch)
 
-        move_steps2 = move[1][0]
-        move_steps1 = move[1][1]
-        move_time = move[1][2]
+        move_steps2, move_steps1, move_time = move[1]
         f_new_x = move[2][0]
         f_new_y = move[2][1]
 
         if self.v_chart.enable:
-            vel_1 = move_steps1 / float(move_time)
-            vel_2 = move_steps2 / float(move_time)
-            vel_tot = plot_utils.distance(move_steps1, move_steps2) / float(move_time)
-            self.v_chart.update(ad_ref, vel_1, vel_2, vel_tot)
-            self.v_chart.vel_data_time += move_time
-            self.v_chart.update(ad_ref, vel_1, vel_2, vel_tot)
-        if ad_ref.rotate_page:
-            if ad_ref.params.auto_rotate_ccw: # Rotate counterclockwise 90 degrees
-                x_new_t = ad_ref.svg_width - f_new_y
-                y_new_t = f_new_x
-                x_old_t = ad_ref.svg_width - ad_ref.pen.phys.ypos
-                y_old_t = ad_ref.pen.phys.xpos
-            else:
-                x_new_t = f_new_y
-                x_old_t = ad_ref.pen.phys.ypos
-                y_new_t = ad_ref.svg_height - f_new_x
-                y_old_t = ad_ref.svg_height - ad_ref.pen.phys.xpos
-        else:
-            x_new_t = f_new_x
-            y_new_t = f_new_y
-            x_old_t = ad_ref.pen.phys.xpos
-            y_old_t = ad_ref.pen.phys.ypos
+            move_time_f = float(move_time)
+            vel_1 = move_steps1 / move_time_f
+            vel_2 = move_steps2 / move_time_f
+            vel_tot = plot_utils.distance(move_steps1, move_steps2) / move_time_f
+            self.v_chart.hold(ad_ref, vel_1, vel_2, vel_tot, move_time)
+
         if ad_ref.pen.phys.z_up:
-            if ad_ref.options.rendering > 1: # Render pen-up movement
-                if ad_ref.pen.status.preview_pen_state != 1:
-                    self.path_data_pu.append(f'M{x_old_t:0.3f} {y_old_t:0.3f}')
-                    ad_ref.pen.status.preview_pen_state = 1
-                self.path_data_pu.append(f' {x_new_t:0.3f} {y_new_t:0.3f}')
+            if ad_ref.options.rendering < 2: # Not rendering pen-up movement
+                return
+            path_data = self.path_data_pu
+            pen_state = 1
         else:
-            if ad_ref.options.rendering in [1, 3]: # Render pen-down movement
-                if ad_ref.pen.status.preview_pen_state != 0:
-                    self.path_data_pd.append(f'M{x_old_t:0.3f} {y_old_t:0.3f}')
-                    ad_ref.pen.status.preview_pen_state = 0
-                self.path_data_pd.append(f' {x_new_t:0.3f} {y_new_t:0.3f}')
+            if ad_ref.options.rendering not in (1, 3): # Not rendering pen-down movement
+                return
+            path_data = self.path_data_pd
+            pen_state = 0
+
+        # The starting point is only needed when beginning a new subpath.
+        if ad_ref.pen.status.preview_pen_state != pen_state:
+            x_old_t, y_old_t = self.page_coords(ad_ref, ad_ref.pen.phys.xpos, ad_ref.pen.phys.ypos)
+            path_data.append(f'M{x_old_t:0.3f} {y_old_t:0.3f}')
+            ad_ref.pen.status.preview_pen_state = pen_state
+        x_new_t, y_new_t = self.page_coords(ad_ref, f_new_x, f_new_y)
+        path_data.append(f' {x_new_t:0.3f} {y_new_t:0.3f}')
+
+    @staticmethod
+    def page_coords(ad_ref, x_pos, y_pos):
+        """ Convert an XY plot position to document coordinates, for rotated pages """
+        if not ad_ref.rotate_page:
+            return x_pos, y_pos
+        if ad_ref.params.auto_rotate_ccw: # Rotate counterclockwise 90 degrees
+            return ad_ref.svg_width - y_pos, x_pos
+        return y_pos, ad_ref.svg_height - x_pos
 
     def render(self, ad_ref):
         """ Render preview layers in the SVG document """
@@ -166,12 +188,8 @@ class Preview:
             return
 
         # Remove old preview layers, whenever preview mode is enabled
-        for node in ad_ref.svg:
-            if node.tag in ('{http://www.w3.org/2000/svg}g', 'g'):
-                if node.get('{http://www.inkscape.org/namespaces/inkscape}groupmode') == 'layer':
-                    layer_name = node.get('{http://www.inkscape.org/namespaces/inkscape}label')
-                    if layer_name == '% Preview':
-                        ad_ref.svg.remove(node)
+        for node in PREVIEW_LAYER_XPATH(ad_ref.svg):
+            ad_ref.svg.remove(node)
 
         if ad_ref.options.rendering == 0: # If preview rendering is disabled
             return
@@ -181,18 +199,17 @@ class Preview:
         preview_transform = simpletransform.parseTransform(
             f'translate({-o_x:.6E},{-o_y:.6E}) scale({1.0/s_x:.6E},{1.0/s_y:.6E})')
         path_attrs = { 'transform': simpletransform.formatTransform(preview_transform)}
-        preview_layer = etree.Element(inkex.addNS('g', 'svg'),
-            path_attrs, nsmap=inkex.NSS)
+        preview_layer = etree.Element(G_TAG, path_attrs, nsmap=inkex.NSS)
 
-        preview_sl_u = etree.SubElement(preview_layer, inkex.addNS('g', 'svg'))
-        preview_sl_d = etree.SubElement(preview_layer, inkex.addNS('g', 'svg'))
+        preview_sl_u = etree.SubElement(preview_layer, G_TAG)
+        preview_sl_d = etree.SubElement(preview_layer, G_TAG)
 
-        preview_layer.set(inkex.addNS('groupmode', 'inkscape'), 'layer')
-        preview_layer.set(inkex.addNS('label', 'inkscape'), '% Preview')
-        preview_sl_d.set(inkex.addNS('groupmode', 'inkscape'), 'layer')
-        preview_sl_d.set(inkex.addNS('label', 'inkscape'), 'Pen-down movement')
-        preview_sl_u.set(inkex.addNS('groupmode', 'inkscape'), 'layer')
-        preview_sl_u.set(inkex.addNS('label', 'inkscape'), 'Pen-up movement')
+        preview_layer.set(GROUPMODE_ATTR, 'layer')
+        preview_layer.set(LABEL_ATTR, '% Preview')
+        preview_sl_d.set(GROUPMODE_ATTR, 'layer')
+        preview_sl_d.set(LABEL_ATTR, 'Pen-down movement')
+        preview_sl_u.set(GROUPMODE_ATTR, 'layer')
+        preview_sl_u.set(LABEL_ATTR, 'Pen-up movement')
 
         ad_ref.svg.append(preview_layer)
 
@@ -216,54 +233,35 @@ class Preview:
             prec = int(math.ceil(-log_ten) + 3)
             width_string = f'{width_du:.{prec}f}'
 
-        p_style = {'stroke-width': width_string, 'fill': 'none',
-            'stroke-linejoin': 'round', 'stroke-linecap': 'round'}
+        # Shared style for every preview path; only the stroke color varies.
+        base_style = f'stroke-width:{width_string};fill:none;' +\
+            'stroke-linejoin:round;stroke-linecap:round;stroke:'
 
-        ns_prefix = "plot"
         if ad_ref.options.rendering > 1:
-            p_style.update({'stroke': ad_ref.params.preview_color_up})
-            path_attrs = {
-                'style': simplestyle.formatStyle(p_style),
-                'd': " ".join(self.path_data_pu),
-                inkex.addNS('desc', ns_prefix): "pen-up transit"}
-            etree.SubElement(preview_sl_u,
-                             inkex.addNS('path', 'svg '), path_attrs, nsmap=inkex.NSS)
+            path_elt = etree.SubElement(preview_sl_u, PATH_TAG, nsmap=inkex.NSS)
+            path_elt.set('style', base_style + ad_ref.params.preview_color_up)
+            path_elt.set('d', " ".join(self.path_data_pu))
+            path_elt.set(DESC_ATTR, "pen-up transit")
 
         if ad_ref.options.rendering in (1, 3):
-            p_style.update({'stroke': ad_ref.params.preview_color_down})
-            path_attrs = {
-                'style': simplestyle.formatStyle(p_style),
-                'd': " ".join(self.path_data_pd),
-                inkex.addNS('desc', ns_prefix): "pen-down drawing"}
-            etree.SubElement(preview_sl_d,
-                             inkex.addNS('path', 'svg '), path_attrs, nsmap=inkex.NSS)
+            path_elt = etree.SubElement(preview_sl_d, PATH_TAG, nsmap=inkex.NSS)
+            path_elt.set('style', base_style + ad_ref.params.preview_color_down)
+            path_elt.set('d', " ".join(self.path_data_pd))
+            path_elt.set(DESC_ATTR, "pen-down drawing")
 
         if ad_ref.options.rendering > 0 and self.v_chart.enable: # Preview enabled w/ velocity
-            self.v_chart.vel_chart1.insert(0, "M")
-            self.v_chart.vel_chart2.insert(0, "M")
-            self.v_chart.vel_data_chart_t.insert(0, "M")
-
-            p_style.update({'stroke': 'black'})
-            path_attrs = {
-                'style': simplestyle.formatStyle(p_style),
-                'd': " ".join(self.v_chart.vel_data_chart_t),
-                inkex.addNS('desc', ns_prefix): "Total V"}
-            etree.SubElement(preview_layer,
-                             inkex.addNS('path', 'svg '), path_attrs, nsmap=inkex.NSS)
-
-            p_style.update({'stroke': 'red'})
-            path_attrs = {
-                'style': simplestyle.formatStyle(p_style),
-                'd': " ".join(self.v_chart.vel_chart1),
-                inkex.addNS('desc', ns_prefix): "Motor 1 V"}
-            etree.SubElement(preview_layer,
-                             inkex.addNS('path', 'svg '), path_attrs, nsmap=inkex.NSS)
-
-            p_style.update({'stroke': 'green'})
-            path_attrs = {
-                'style': simplestyle.formatStyle(p_style),
-                'd': " ".join(self.v_chart.vel_chart2),
-                inkex.addNS('desc', ns_prefix): "Motor 2 V"}
-            etree.SubElement(preview_layer,
-                             inkex.addNS('path', 'svg '), path_attrs, nsmap=inkex.NSS)
+            path_elt = etree.SubElement(preview_layer, PATH_TAG, nsmap=inkex.NSS)
+            path_elt.set('style', base_style + 'black')
+            path_elt.set('d', self.v_chart.path_data(self.v_chart.vel_data_chart_t))
+            path_elt.set(DESC_ATTR, "Total V")
+
+            path_elt = etree.SubElement(preview_layer, PATH_TAG, nsmap=inkex.NSS)
+            path_elt.set('style', base_style + 'red')
+            path_elt.set('d', self.v_chart.path_data(self.v_chart.vel_chart1))
+            path_elt.set(DESC_ATTR, "Motor 1 V")
+
+            path_elt = etree.SubElement(preview_layer, PATH_TAG, nsmap=inkex.NSS)
+            path_elt.set('style', base_style + 'green')
+            path_elt.set('d', self.v_chart.path_data(self.v_chart.vel_chart2))
+            path_elt.set(DESC_ATTR, "Motor 2 V")
 
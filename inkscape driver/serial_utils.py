@@ -66,7 +66,7 @@ def connect(options, plot_status, message_fun, logger):
     plot_status.fw_version = fw_version_string.strip() # For number comparisons
 
     if port_name:
-        logger.debug('Connected successfully to port: ' + str(port_name))
+        logger.debug('Connected successfully to port: %s', port_name)
     else:
         logger.debug(" Connected successfully")
     return True